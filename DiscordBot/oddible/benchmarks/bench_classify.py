@@ -0,0 +1,104 @@
+"""
+Micro-benchmark: compiled classify_pick(), memoised or not, vs the original substring version.
+
+Run from the DiscordBot folder:
+    python -m oddible.benchmarks.bench_classify [--picks 5000] [--repeat 5]
+
+Uses the hand-made /trending-shaped fixture in benchmarks/corpus/ (not a
+recorded response; it covers the market names we classify), tiled up to
+--picks, and checks both classifiers agree on every pick before timing.
+"""
+import argparse
+import json
+import time
+from pathlib import Path
+
+from oddible.utils import classify_pick, _classify_strings
+
+CORPUS_DIR = Path(__file__).resolve().parent / "corpus"
+
+
+def classify_pick_legacy(p: dict) -> str:
+    """classify_pick() as it was before the compiled classifier (reference)."""
+    market = (p.get("market") or "").lower()
+    name = (p.get("outcome_name") or "").lower()
+
+    stat_terms = [
+        "points","assists","rebounds","pra","steals","blocks",
+        "threes","3pt","three pointers","made threes",
+        "turnovers","yards","touchdowns","receptions",
+        "completions","passing","rushing","receiving"
+    ]
+    if any(term in market for term in stat_terms):
+        return "player_props"
+    if any(term in name for term in stat_terms):
+        return "player_props"
+
+    if "spread" in market or "handicap" in market or "ats" in market:
+        return "spread"
+
+    if "total" in market:
+        return "totals"
+    if name in ("over", "under"):
+        return "totals"
+
+    if "moneyline" in market or market == "ml":
+        return "moneyline"
+
+    return "other"
+
+
+def load_corpus_picks() -> list:
+    picks = []
+    for path in sorted(CORPUS_DIR.glob("*.json")):
+        with open(path, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+        picks.extend((raw.get("data") or {}).get("picks") or [])
+    return picks
+
+
+def tile(picks: list, n: int) -> list:
+    return [picks[i % len(picks)] for i in range(n)]
+
+
+def best_of(fn, picks: list, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for p in picks:
+            fn(p)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--picks", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = load_corpus_picks()
+    picks = tile(corpus, args.picks)
+
+    mismatches = [p for p in corpus if classify_pick(p) != classify_pick_legacy(p)]
+    if mismatches:
+        raise SystemExit(f"{len(mismatches)} picks classified differently, e.g. {mismatches[0]}")
+
+    def classify_pick_uncached(p: dict) -> str:
+        return _classify_strings.__wrapped__(p.get("market") or "", p.get("outcome_name") or "")
+
+    legacy = best_of(classify_pick_legacy, picks, args.repeat)
+    cold = best_of(classify_pick_uncached, picks, args.repeat)
+    compiled = best_of(classify_pick, picks, args.repeat)
+
+    print(f"corpus: {len(corpus)} hand-made picks, tiled to {len(picks)}")
+    print(f"legacy   : {legacy * 1e6 / len(picks):7.3f} µs/pick  ({legacy * 1e3:.2f} ms total)")
+    print(f"no memo  : {cold * 1e6 / len(picks):7.3f} µs/pick  ({cold * 1e3:.2f} ms total)")
+    print(f"compiled : {compiled * 1e6 / len(picks):7.3f} µs/pick  ({compiled * 1e3:.2f} ms total)")
+    # The tiled corpus repeats a few dozen market / outcome pairs, so the
+    # memoised figure is mostly cache hits; "no memo" is the pattern work alone.
+    print(f"speed-up : {legacy / cold:.2f}x without the memo, {legacy / compiled:.2f}x with it")
+
+
+if __name__ == "__main__":
+    main()
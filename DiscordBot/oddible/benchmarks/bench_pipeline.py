@@ -0,0 +1,231 @@
+"""
+Benchmark: every stage of the Oddible rendering pipeline vs. pick count.
+
+Run from the DiscordBot folder:
+    python -m oddible.benchmarks.bench_pipeline [--sizes 20 200 2000 20000] [--repeat 5]
+    python -m oddible.benchmarks.bench_pipeline --save     # write a new baseline
+    python -m oddible.benchmarks.bench_pipeline --check    # exit 1 on regressions
+
+Corpora: "handmade" tiles the hand-made /trending-shaped fixture in
+benchmarks/corpus/ (not a recorded response) up to each size, "synthetic"
+comes from the seeded offline generator. Each stage
+is timed best-of --repeat, then run once more under tracemalloc for its peak
+allocation. Whole-response stages get a fresh envelope every run, so the
+per-response memos (Pick records, columns, rendered embeds) start cold;
+the "(warm)" row shows a repeat render of the same response.
+
+Results are compared against baselines/pipeline.json (if present). The
+baseline records a hash of utils.py, and --check refuses (exit 2) to use
+a baseline measured against a different one: re-record it with --save
+whenever utils.py changes. Timings on a busy machine wobble; peak allocations
+are deterministic, so a memory regression is always real.
+"""
+import argparse
+import datetime
+import gc
+import hashlib
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List
+
+os.environ.setdefault("ODDIBLE_API_KEY", "benchmark")  # oddible_cog refuses to import without one
+
+from oddible import oddible_cog, utils
+from oddible.offline.generator import generate_response
+from oddible.utils import (
+    build_discord_message_grouped,
+    dedupe_and_diversify,
+    format_deeplink_block,
+    format_pick_line,
+    group_picks_by_type,
+    parse_deeplinks,
+    select_group_picks,
+)
+
+BENCH_DIR = Path(__file__).resolve().parent
+CORPUS_DIR = BENCH_DIR / "corpus"
+BASELINE_PATH = BENCH_DIR / "baselines" / "pipeline.json"
+
+DEFAULT_SIZES = [20, 200, 2000, 20000]
+
+
+def load_handmade(n: int) -> dict:
+    picks: List[dict] = []
+    for path in sorted(CORPUS_DIR.glob("*.json")):
+        with open(path, "r", encoding="utf-8") as f:
+            picks.extend(((json.load(f).get("data") or {}).get("picks")) or [])
+    tiled = [picks[i % len(picks)] for i in range(n)]
+    return {"status": "success", "data": {"count": n, "leagues": ["NBA"], "picks": tiled}}
+
+
+def load_synthetic(n: int) -> dict:
+    return generate_response(n, leagues=["NBA"], seed=0)
+
+
+CORPORA: Dict[str, Callable[[int], dict]] = {
+    "handmade": load_handmade,
+    "synthetic": load_synthetic,
+}
+
+
+def fresh(raw: dict) -> dict:
+    """
+    Same picks, new envelope, empty per-response memo: the pipeline starts
+    cold and memo evictions don't leak into the allocation numbers.
+    """
+    utils._NORMALIZED.clear()
+    return {"status": raw.get("status"), "data": dict(raw["data"])}
+
+
+def stages(raw: dict) -> Dict[str, Callable[[], object]]:
+    picks = raw["data"]["picks"]
+    grouped = group_picks_by_type(picks)
+    warm = fresh(raw)
+    build_discord_message_grouped(warm)
+
+    def select_all():
+        for gkey, bucket in grouped.items():
+            select_group_picks(gkey, bucket, 3)
+
+    def embeds_cold():
+        oddible_cog.EMBED_CACHE.clear()
+        oddible_cog.build_grouped_pick_embeds(fresh(raw))
+
+    return {
+        "dedupe_and_diversify": lambda: dedupe_and_diversify(picks, max_out=len(picks)),
+        "group_picks_by_type": lambda: group_picks_by_type(picks),
+        "select_group_picks": select_all,
+        "format_pick_line": lambda: [format_pick_line(p) for p in picks],
+        "format_deeplink_block": lambda: [
+            format_deeplink_block(parse_deeplinks(p.get("deepLinks", ""))) for p in picks
+        ],
+        "build_discord_message_grouped": lambda: build_discord_message_grouped(fresh(raw)),
+        "build_discord_message_grouped (warm)": lambda: build_discord_message_grouped(warm),
+        "build_grouped_pick_embeds": embeds_cold,
+    }
+
+
+def measure(fn: Callable[[], object], repeat: int) -> Dict[str, float]:
+    best = float("inf")
+    gc.disable()  # like timeit: keep collector pauses out of the timings
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"ms": best * 1e3, "peak_kib": peak / 1024}
+
+
+def utils_fingerprint() -> str:
+    return hashlib.sha1(Path(utils.__file__).read_bytes()).hexdigest()[:12]
+
+
+def run(sizes: List[int], repeat: int, only: List[str] | None) -> Dict[str, Dict[str, float]]:
+    results: Dict[str, Dict[str, float]] = {}
+    for corpus_name, load in CORPORA.items():
+        for n in sizes:
+            raw = load(n)
+            for stage, fn in stages(raw).items():
+                if only and not any(o in stage for o in only):
+                    continue
+                r = measure(fn, repeat)
+                results[f"{corpus_name}/{n}/{stage}"] = r
+                print(f"{corpus_name:<9} {n:>6}  {stage:<38} {r['ms']:10.3f} ms  {r['peak_kib']:10.1f} KiB")
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: dict, tolerance: float) -> List[str]:
+    regressions = []
+    base_results = baseline.get("results", {})
+    for key, r in results.items():
+        base = base_results.get(key)
+        if not base:
+            continue
+        for metric in ("ms", "peak_kib"):
+            # Ignore noise on tiny numbers (under 1 ms / 16 KiB)
+            floor = 1.0 if metric == "ms" else 16.0
+            if r[metric] > max(base[metric], floor) * (1 + tolerance):
+                regressions.append(
+                    f"{key} {metric}: {base[metric]:.2f} -> {r[metric]:.2f} "
+                    f"(+{(r[metric] / max(base[metric], 1e-9) - 1):.0%})"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--stage", action="append", help="only stages containing this text")
+    parser.add_argument("--save", action="store_true", help=f"write results to {BASELINE_PATH.name}")
+    parser.add_argument("--check", action="store_true", help="exit 1 if anything regressed")
+    parser.add_argument("--tolerance", type=float, default=0.50, help="allowed slow-down (0.50 = 50%%)")
+    args = parser.parse_args()
+
+    baseline = None
+    if BASELINE_PATH.exists():
+        with open(BASELINE_PATH, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    # A baseline measured against another utils.py says nothing about this one
+    if args.check and not args.save and baseline is not None:
+        recorded_sha = baseline.get("meta", {}).get("utils_sha1")
+        if recorded_sha != utils_fingerprint():
+            print(f"baseline was recorded against utils {recorded_sha}, now {utils_fingerprint()}: "
+                  f"re-record it with --save before using --check")
+            sys.exit(2)
+
+    results = run(args.sizes, args.repeat, args.stage)
+
+    regressions: List[str] = []
+    if baseline is not None:
+        meta = baseline.get("meta", {})
+        print(f"\nbaseline: {meta.get('created')} • utils {meta.get('utils_sha1')} "
+              f"(now {utils_fingerprint()}) • {meta.get('machine')}")
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+        else:
+            print(f"no regressions beyond {args.tolerance:.0%}")
+
+    if args.save:
+        BASELINE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        record = {
+            "meta": {
+                "created": datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "utils_sha1": utils_fingerprint(),
+                "python": platform.python_version(),
+                "machine": f"{platform.system()} {platform.machine()}",
+                "repeat": args.repeat,
+            },
+            "results": {k: {m: round(v, 3) for m, v in r.items()} for k, r in results.items()},
+        }
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(record, f, indent=1, sort_keys=True)
+            f.write("\n")
+        print(f"saved baseline -> {BASELINE_PATH}")
+
+    if args.check and regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -26,31 +26,122 @@ BOOKS_US = [
 ]
 # If you want Canada or EU presets later, add them here.
 
+# Other names people type for a book -> canonical slug
+BOOK_ALIASES = {
+    "dk": "draftkings",
+    "fd": "fanduel",
+    "mgm": "betmgm",
+    "espn": "espnbet",
+    "bet365": "bet365_us",
+    "caesars": "williamhill_us",
+    "czr": "williamhill_us",
+    "hardrock": "hardrockbet",
+    "bally": "ballybet",
+    "mybookie": "mybookieag",
+    "betonline": "betonlineag",
+    "888sport": "sport888",
+    "1xbet": "onexbet",
+}
+
+# Typo fallback only kicks in between names at least this long on both
+# sides: short words are a letter away from too many things ("dk" ≠ "dx",
+# "bets" ≠ "betus", "tabs" ≠ "tab")
+FUZZY_MIN_LENGTH = 5
+
+
+def relax_book_name(name: str) -> str:
+    """Spelling-insensitive form: lower-case, no spaces / hyphens / underscores / dots."""
+    return "".join(ch for ch in name.lower() if ch not in " -_.")
+
+
+def _one_edit_apart(a: str, b: str) -> bool:
+    """At most one insert / delete / substitution / adjacent swap between a and b."""
+    if a == b:
+        return True
+    if abs(len(a) - len(b)) > 1:
+        return False
+    i = 0
+    while i < min(len(a), len(b)) and a[i] == b[i]:
+        i += 1
+    if len(a) == len(b):
+        return a[i + 1:] == b[i + 1:] or (a[i:i + 2] == b[i:i + 2][::-1] and a[i + 2:] == b[i + 2:])
+    return a[i + 1:] == b[i:] if len(a) > len(b) else a[i:] == b[i + 1:]
+
+
+class BookRegistry:
+    """
+    Sportsbook name lookup, built once.
+
+    Canonical slugs and aliases are indexed as written (lower-cased) and
+    in relaxed form (case, spaces, hyphens, underscores and dots ignored),
+    so "DraftKings", "draft-kings" and "DK" all resolve with a dict lookup.
+    Anything else goes through a typo index: every relaxed name with one
+    character deleted, so a one-letter slip ("fandual", "draftkigns")
+    resolves with a handful of lookups instead of a scan. Typos are only
+    matched when both names are at least FUZZY_MIN_LENGTH long, and a typo
+    that is equally close to two books resolves to nothing.
+    """
+
+    def __init__(self, slugs: list[str], aliases: dict[str, str], deeplinks: set[str]):
+        self.slugs = list(slugs)
+        self._known = set(self.slugs)
+        self._deeplinks = set(deeplinks)
+        self._exact: dict[str, str] = {}
+        self._relaxed: dict[str, str] = {}
+        self._deletes: dict[str, set[str]] = {}
+
+        names = [(slug, slug) for slug in self.slugs] + list(aliases.items())
+        for name, slug in names:
+            self._exact.setdefault(name.lower(), slug)
+            relaxed = relax_book_name(name)
+            self._relaxed.setdefault(relaxed, slug)
+            for variant in self._delete_variants(relaxed):
+                self._deletes.setdefault(variant, set()).add(relaxed)
+
+    @staticmethod
+    def _delete_variants(word: str) -> set[str]:
+        return {word} | {word[:i] + word[i + 1:] for i in range(len(word))}
+
+    def __contains__(self, slug: str) -> bool:
+        return slug in self._known
+
+    def has_deeplinks(self, slug: str) -> bool:
+        return slug in self._deeplinks
+
+    def resolve(self, name: str, fuzzy: bool = True) -> str:
+        """Canonical slug for a book name / alias / near miss, else ''."""
+        if not name:
+            return ""
+        slug = self._exact.get(name.lower())
+        if slug:
+            return slug
+        relaxed = relax_book_name(name)
+        slug = self._relaxed.get(relaxed)
+        if slug or not fuzzy or len(relaxed) < FUZZY_MIN_LENGTH:
+            return slug or ""
+
+        matches = {
+            self._relaxed[candidate]
+            for variant in self._delete_variants(relaxed)
+            for candidate in self._deletes.get(variant, ())
+            if len(candidate) >= FUZZY_MIN_LENGTH and _one_edit_apart(relaxed, candidate)
+        }
+        return matches.pop() if len(matches) == 1 else ""
+
+
+BOOKS = BookRegistry(BOOKS_ALL, BOOK_ALIASES, BOOKS_WITH_DEEPLINKS)
+
+
 def normalize_book(name: str) -> str:
     """
-    Lowercase + strip spaces/underscores to attempt a best-effort match.
-    Returns the canonical slug if we recognize it, else ''.
+    Best-effort match of a user-typed book name (any case / spacing, an
+    alias, or a one-letter typo) to its canonical slug. '' if unknown.
     """
-    if not name:
-        return ""
-    raw = name.lower().replace(" ", "").replace("-", "").replace("__", "_")
-    # quick direct hits first
-    if name.lower() in BOOKS_ALL:
-        return name.lower()
-    # relaxed matching (add any aliases you want here)
-    aliases = {
-        "dk": "draftkings",
-        "fd": "fanduel",
-        "mgm": "betmgm",
-        "espn": "espnbet",
-        "bet365": "bet365_us",
-        "prize picks": "prizepicks",
-    }
-    return aliases.get(raw, name.lower() if name.lower() in BOOKS_ALL else "")
+    return BOOKS.resolve(name)
 
 def validate_books(selected: list[str] | None, fallback: list[str] | None = None) -> list[str]:
     """
-    Validate a user/dev-provided list against BOOKS_ALL.
+    Validate a user/dev-provided list against BOOKS_ALL (duplicates dropped).
     If empty/None or all invalid, fall back to the provided fallback or a sane default.
     """
     if not selected:
@@ -58,7 +149,7 @@ def validate_books(selected: list[str] | None, fallback: list[str] | None = None
     cleaned = []
     for b in selected:
         nb = normalize_book(b)
-        if nb and nb in BOOKS_ALL:
+        if nb and nb not in cleaned:
             cleaned.append(nb)
     if cleaned:
         return cleaned
@@ -70,5 +161,5 @@ def prioritize_deeplink_books(books: list[str], max_n: int | None = None) -> lis
     Reorders a list so deeplink-capable books come first.
     Optionally cap the length with max_n.
     """
-    deeplink_first = sorted(books, key=lambda b: (b not in BOOKS_WITH_DEEPLINKS, b))
+    deeplink_first = sorted(books, key=lambda b: (not BOOKS.has_deeplinks(b), b))
     return deeplink_first[:max_n] if max_n else deeplink_first
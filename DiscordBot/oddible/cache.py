@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+def payload_key(
+    leagues: List[str],
+    num_picks: int = 20,
+    risk: str = "moderate",
+    sportsbooks: List[str] | None = None,
+    player_props: bool | None = None,
+) -> tuple:
+    """
+    Normalise a /trending request into a hashable cache key.
+    League / book order and case don't change the response, so they don't
+    change the key either. player_props=None and False stay distinct because
+    they produce different payloads.
+    """
+    return (
+        tuple(sorted(l.upper() for l in leagues)),
+        int(num_picks),
+        (risk or "").lower(),
+        tuple(sorted(b.lower() for b in (sportsbooks or ["draftkings"]))),
+        None if player_props is None else bool(player_props),
+    )
+
+
+class TTLCache:
+    """
+    Small in-process TTL cache with LRU eviction and hit/miss counters.
+
+    Entries older than `ttl` seconds count as misses. They are kept around
+    for another `max_stale` seconds so get_stale() can still serve them as a
+    last-known-good fallback, then dropped.
+    Once `max_entries` is reached the least recently used entry is evicted.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        max_entries: int = 64,
+        max_stale: float = 0.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_stale = max_stale
+        self.clock = clock
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, count=False) is not None
+
+    def get(self, key: Hashable, count: bool = True) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is not None:
+            stored_at, value = entry
+            age = self.clock() - stored_at
+            if age <= self.ttl:
+                self._data.move_to_end(key)
+                if count:
+                    self.hits += 1
+                return value
+            if age > self.ttl + self.max_stale:
+                del self._data[key]
+        if count:
+            self.misses += 1
+        return None
+
+    def get_stale(self, key: Hashable) -> Optional[Tuple[Any, float]]:
+        """
+        Return (value, age_seconds) for a key even if its TTL has passed,
+        as long as it's within the stale window. None if nothing usable.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        age = self.clock() - stored_at
+        if age > self.ttl + self.max_stale:
+            del self._data[key]
+            return None
+        return value, age
+
+    def set(self, key: Hashable, value: Any, stored_at: float | None = None):
+        self._data[key] = (self.clock() if stored_at is None else stored_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._data),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+        }
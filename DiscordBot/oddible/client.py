@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import aiohttp
+
+from .streaming import PicksStreamParser
+
+# Default timeouts (seconds). `total` matches the old requests.post(timeout=20).
+DEFAULT_TIMEOUT = 20.0
+DEFAULT_CONNECT_TIMEOUT = 5.0
+
+# Bytes read per step when streaming a response body
+STREAM_CHUNK_SIZE = 16 * 1024
+
+
+def build_trending_payload(
+    leagues: List[str],
+    num_picks: int = 20,
+    risk: str = "moderate",
+    sportsbooks: List[str] | None = None,
+    player_props: bool | None = None,
+) -> Dict[str, Any]:
+    """Build the JSON body Oddible's /trending endpoint expects."""
+    payload: Dict[str, Any] = {
+        "leagues": leagues,
+        "num_picks": num_picks,
+        "sportsbooks": sportsbooks or ["draftkings"],
+        "risk": risk,
+    }
+    if player_props is not None:
+        payload["player_props"] = bool(player_props)
+    return payload
+
+
+class OddibleClient:
+    """
+    Async client for Oddible's /trending endpoint.
+
+    Owns one pooled aiohttp.ClientSession for its whole lifetime, so
+    connections are kept alive between commands instead of re-doing the
+    TLS handshake every time. The session is created lazily (it has to be
+    created inside the running event loop) and closed via close().
+    """
+
+    def __init__(
+        self,
+        url: str,
+        api_key: str,
+        timeout: float = DEFAULT_TIMEOUT,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        pool_size: int = 10,
+        keepalive: float = 60.0,
+    ):
+        self.url = url
+        self.headers = {
+            "Content-Type": "application/json",
+            "X-API-Key": api_key,
+        }
+        self.timeout = aiohttp.ClientTimeout(total=timeout, connect=connect_timeout)
+        self.pool_size = pool_size
+        self.keepalive = keepalive
+        self._session: aiohttp.ClientSession | None = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                keepalive_timeout=self.keepalive,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                timeout=self.timeout,
+            )
+        return self._session
+
+    def _request_kwargs(self, payload: Dict[str, Any], timeout: float | None) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = {"json": payload}
+        # Only override when asked: aiohttp reads timeout=None as "no timeout at all",
+        # which would silently drop the session's default.
+        if timeout is not None:
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout, connect=self.timeout.connect)
+        return kwargs
+
+    async def close(self):
+        """Close the pooled session (call from cog_unload)."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def fetch_trending(
+        self,
+        leagues: List[str],
+        num_picks: int = 20,
+        risk: str = "moderate",
+        sportsbooks: List[str] | None = None,
+        player_props: bool | None = None,
+        timeout: float | None = None,
+        stream: bool = False,
+        on_pick: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    ) -> Tuple[int, Dict[str, Any], Dict[str, Any]]:
+        """
+        Call Oddible's /trending endpoint and return (status_code, headers, json_data).
+        Same contract as the old blocking fetch_trending(): network problems come
+        back as status 0 with a {"status": ..., "message": ...} body.
+
+        With stream=True a 200 body is parsed incrementally: data.picks is
+        decoded one pick at a time as bytes arrive, unrendered fields are
+        dropped straight away, and on_pick (if given) sees each pick as soon
+        as it's complete.
+        """
+        payload = build_trending_payload(
+            leagues,
+            num_picks=num_picks,
+            risk=risk,
+            sportsbooks=sportsbooks,
+            player_props=player_props,
+        )
+        request_kwargs = self._request_kwargs(payload, timeout)
+
+        try:
+            session = await self._get_session()
+            async with session.post(self.url, **request_kwargs) as resp:
+                if stream and resp.status == 200:
+                    return resp.status, dict(resp.headers), await self._read_streamed(resp, on_pick)
+                text = await resp.text()
+                try:
+                    data = json.loads(text)
+                except Exception:
+                    data = {"status": "error", "raw": text}
+                return resp.status, dict(resp.headers), data
+
+        except asyncio.TimeoutError:
+            return 0, {}, {
+                "status": "timeout",
+                "message": "Request to Oddible timed out. The API may be slow or unavailable.",
+            }
+        except aiohttp.ClientError as e:
+            return 0, {}, {
+                "status": "error",
+                "message": f"Network error talking to Oddible: {e}",
+            }
+
+    @staticmethod
+    async def _read_streamed(
+        resp: aiohttp.ClientResponse,
+        on_pick: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    ) -> Dict[str, Any]:
+        parser = PicksStreamParser()
+        picks: List[Dict[str, Any]] = []
+        async for chunk in resp.content.iter_chunked(STREAM_CHUNK_SIZE):
+            for p in parser.feed(chunk):
+                picks.append(p)
+                if on_pick is not None:
+                    on_pick(p)
+        try:
+            data, tail = parser.close()
+        except ValueError:
+            return {"status": "error", "raw": "Oddible returned a malformed or truncated response."}
+        for p in tail:
+            picks.append(p)
+            if on_pick is not None:
+                on_pick(p)
+
+        if isinstance(data.get("data"), dict) and "picks" in data["data"]:
+            data["data"]["picks"] = picks
+        return data
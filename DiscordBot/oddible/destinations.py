@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, List
+
+from .regions import DEFAULT_STATE
+from .snapshots import JsonFileStore
+
+
+class AutopostDestination:
+    """One place the daily boards go: a channel plus the deeplink region to use."""
+
+    __slots__ = ("channel_id", "state")
+
+    def __init__(self, channel_id: int, state: str = DEFAULT_STATE):
+        self.channel_id = int(channel_id)
+        self.state = (state or DEFAULT_STATE).lower()
+
+    def __repr__(self) -> str:
+        return f"AutopostDestination({self.channel_id}, {self.state!r})"
+
+
+class DestinationRegistry(JsonFileStore):
+    """
+    Every auto-post destination, keyed by channel ID (one entry per channel).
+    Channels can live in any guild the bot is in (free picks, VIP, partners).
+    """
+
+    def __init__(self, path: Path | str):
+        super().__init__(path)
+        self._by_channel: Dict[int, AutopostDestination] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_channel)
+
+    def __contains__(self, channel_id: int) -> bool:
+        return channel_id in self._by_channel
+
+    def all(self) -> List[AutopostDestination]:
+        return list(self._by_channel.values())
+
+    def states(self) -> List[str]:
+        """Distinct deeplink regions in use (each league is rendered once per region)."""
+        return list(dict.fromkeys(d.state for d in self._by_channel.values()))
+
+    def state_for(self, channel_id: int) -> str:
+        """Deeplink region for a channel (DEFAULT_STATE if it isn't a destination)."""
+        dest = self._by_channel.get(channel_id)
+        return dest.state if dest is not None else DEFAULT_STATE
+
+    def add(self, channel_id: int, state: str = DEFAULT_STATE) -> AutopostDestination:
+        dest = AutopostDestination(channel_id, state)
+        self._by_channel[dest.channel_id] = dest
+        return dest
+
+    def remove(self, channel_id: int) -> bool:
+        return self._by_channel.pop(channel_id, None) is not None
+
+    def snapshot(self) -> list:
+        return [{"channel_id": d.channel_id, "state": d.state} for d in self._by_channel.values()]
+
+    def _from_record(self, raw: list):
+        entries = [AutopostDestination(d["channel_id"], d.get("state")) for d in raw]
+        self._by_channel = {d.channel_id: d for d in entries}
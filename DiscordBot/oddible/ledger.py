@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import datetime
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .utils import Pick, get_team_resolver, pick_key
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS picks (
+    id            INTEGER PRIMARY KEY,
+    posted_at     REAL    NOT NULL,
+    post_date     TEXT    NOT NULL,   -- local day, YYYY-MM-DD
+    board         TEXT    NOT NULL,   -- "NBA", "NBA Player Props", ...
+    league        TEXT    NOT NULL,
+    grp           TEXT    NOT NULL,   -- market group (spread, totals, ...)
+    market        TEXT,
+    outcome_name  TEXT,
+    outcome_point REAL,
+    player        TEXT COLLATE NOCASE,
+    home_team     TEXT,
+    away_team     TEXT,
+    home_abbr     TEXT,
+    away_abbr     TEXT,
+    odds          REAL,
+    hit_wins      INTEGER,
+    hit_total     INTEGER,
+    hit_rate      REAL,
+    commence_time TEXT,
+    pick_key      TEXT    NOT NULL    -- hash of utils.pick_key(): same bet, whatever the odds
+);
+
+-- One row per pick per board per day, however many channels showed it
+-- and however often it was re-posted / refreshed with new odds
+CREATE UNIQUE INDEX IF NOT EXISTS picks_once_per_day
+    ON picks (post_date, board, pick_key);
+CREATE INDEX IF NOT EXISTS picks_by_league  ON picks (league, post_date);
+CREATE INDEX IF NOT EXISTS picks_by_group   ON picks (league, grp, post_date);
+CREATE INDEX IF NOT EXISTS picks_by_player  ON picks (player, post_date);
+CREATE INDEX IF NOT EXISTS picks_by_home    ON picks (home_abbr, post_date);
+CREATE INDEX IF NOT EXISTS picks_by_away    ON picks (away_abbr, post_date);
+CREATE INDEX IF NOT EXISTS picks_by_date    ON picks (post_date);
+
+-- Append-only: history is never rewritten
+CREATE TRIGGER IF NOT EXISTS picks_no_update BEFORE UPDATE ON picks
+    BEGIN SELECT RAISE(ABORT, 'pick ledger is append-only'); END;
+CREATE TRIGGER IF NOT EXISTS picks_no_delete BEFORE DELETE ON picks
+    BEGIN SELECT RAISE(ABORT, 'pick ledger is append-only'); END;
+
+-- Which channels each pick was posted to
+CREATE TABLE IF NOT EXISTS pick_channels (
+    pick_id    INTEGER NOT NULL REFERENCES picks (id),
+    channel_id INTEGER NOT NULL,
+    PRIMARY KEY (pick_id, channel_id)
+) WITHOUT ROWID;
+
+-- Per day / league / group totals, kept up to date on every insert
+CREATE TABLE IF NOT EXISTS daily_rollups (
+    post_date    TEXT    NOT NULL,
+    league       TEXT    NOT NULL,
+    grp          TEXT    NOT NULL,
+    picks        INTEGER NOT NULL DEFAULT 0,
+    hit_rate_sum REAL    NOT NULL DEFAULT 0,
+    hit_rate_n   INTEGER NOT NULL DEFAULT 0,
+    odds_sum     REAL    NOT NULL DEFAULT 0,
+    odds_n       INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (post_date, league, grp)
+);
+"""
+
+_INSERT = """
+INSERT OR IGNORE INTO picks (
+    posted_at, post_date, board, league, grp, market, outcome_name,
+    outcome_point, player, home_team, away_team, home_abbr, away_abbr, odds,
+    hit_wins, hit_total, hit_rate, commence_time, pick_key
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_PICK_ID = "SELECT id FROM picks WHERE post_date = ? AND board = ? AND pick_key = ?"
+
+_POSTED_TO = "INSERT OR IGNORE INTO pick_channels (pick_id, channel_id) VALUES (?, ?)"
+
+_ROLLUP = """
+INSERT INTO daily_rollups (post_date, league, grp, picks, hit_rate_sum, hit_rate_n, odds_sum, odds_n)
+VALUES (?, ?, ?, 1, ?, ?, ?, ?)
+ON CONFLICT (post_date, league, grp) DO UPDATE SET
+    picks        = picks + 1,
+    hit_rate_sum = hit_rate_sum + excluded.hit_rate_sum,
+    hit_rate_n   = hit_rate_n + excluded.hit_rate_n,
+    odds_sum     = odds_sum + excluded.odds_sum,
+    odds_n       = odds_n + excluded.odds_n
+"""
+
+# Positions in the _INSERT parameter tuple that also feed the rollup / _PICK_ID
+_POST_DATE, _BOARD, _LEAGUE, _GRP, _ODDS, _HIT_RATE, _PICK_KEY = 1, 2, 3, 4, 13, 16, 18
+
+_COLUMNS = (
+    "posted_at", "post_date", "board", "league", "grp", "market", "outcome_name",
+    "outcome_point", "player", "home_team", "away_team", "home_abbr", "away_abbr",
+    "odds", "hit_wins", "hit_total", "hit_rate",
+)
+
+
+def _number(value: Any) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def row_as_pick(row: Dict[str, Any]) -> Dict[str, Any]:
+    """A history row in the shape of an Oddible pick, for format_pick_line()."""
+    return {
+        "league": row["league"],
+        "home_team": row["home_team"],
+        "away_team": row["away_team"],
+        "home_team_abbreviation": row["home_abbr"],
+        "away_team_abbreviation": row["away_abbr"],
+        "market": row["market"],
+        "outcome_name": row["outcome_name"],
+        "outcome_description": row["player"] or "",
+        "outcome_point": row["outcome_point"],
+        "bestOdds": row["odds"],
+    }
+
+
+class PickLedger:
+    """
+    Append-only SQLite history of every pick the bot has posted.
+
+    One row per pick per board per day: posting it to several channels,
+    re-posting it or refreshing it with new odds doesn't add rows (the
+    channels it went to are kept in pick_channels). Indexed by league,
+    date, market group, player and team, with daily per league/group
+    rollups bumped in the same transaction the first time a pick is seen
+    that day, so summaries read a handful of rollup rows instead of the
+    whole history.
+    All methods block; call them via asyncio.to_thread from the cog.
+    """
+
+    def __init__(self, path: Path | str, tz: datetime.tzinfo = datetime.timezone.utc):
+        self.path = Path(path)
+        self.tz = tz
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def day_of(self, ts: float) -> str:
+        return datetime.datetime.fromtimestamp(ts, self.tz).strftime("%Y-%m-%d")
+
+    # ---------------- writes ----------------
+
+    def record(
+        self,
+        channel_id: int,
+        board: str,
+        picks: Iterable[Pick],
+        posted_at: float | None = None,
+    ) -> int:
+        """Append the picks of one posted board. Returns how many picks were new today."""
+        posted_at = time.time() if posted_at is None else posted_at
+        post_date = self.day_of(posted_at)
+        added = 0
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                for p in picks:
+                    row = self._row(p, board, posted_at, post_date)
+                    if conn.execute(_INSERT, row).rowcount == 1:
+                        added += 1
+                        league, grp, odds, hit_rate = row[_LEAGUE], row[_GRP], row[_ODDS], row[_HIT_RATE]
+                        conn.execute(_ROLLUP, (
+                            post_date, league, grp,
+                            hit_rate or 0.0, int(hit_rate is not None),
+                            odds or 0.0, int(odds is not None),
+                        ))
+                    pick_id = conn.execute(_PICK_ID, (row[_POST_DATE], row[_BOARD], row[_PICK_KEY])).fetchone()[0]
+                    conn.execute(_POSTED_TO, (pick_id, channel_id))
+        return added
+
+    @staticmethod
+    def _row(p: Pick, board: str, posted_at: float, post_date: str) -> tuple:
+        league = (p.get("league") or board.split()[0]).upper()
+        resolver = get_team_resolver(league)
+        home, away = p.get("home_team") or "", p.get("away_team") or ""
+        home_abbr = p.get("home_team_abbreviation") or (resolver.exact(home) if resolver else None)
+        away_abbr = p.get("away_team_abbreviation") or (resolver.exact(away) if resolver else None)
+        player = (p.get("outcome_description") or "").strip() if p.group == "player_props" else ""
+        return (
+            posted_at, post_date, board, league, p.group,
+            p.get("market"), p.get("outcome_name"), _number(p.get("outcome_point")),
+            player or None, home or None, away or None, home_abbr, away_abbr,
+            _number(p.get("bestOdds")),
+            p.get("hit_rate_wins"), p.get("hit_rate_total"), _number(p.get("hit_rate_percentage")),
+            p.get("commence_time"),
+            hashlib.sha1(repr(pick_key(p)).encode("utf-8")).hexdigest()[:20],
+        )
+
+    # ---------------- reads ----------------
+
+    def _since(self, days: int) -> str:
+        return self.day_of(time.time() - max(0, days - 1) * 86400)
+
+    def history(
+        self,
+        league: str | None = None,
+        days: int = 30,
+        group: str | None = None,
+        player: str | None = None,
+        team: str | None = None,
+        limit: int = 15,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Most recent matching picks (newest first) plus the total match count.
+        `player` matches the full name case-insensitively, falling back to
+        part of a name; `team` is a name, nickname or abbreviation.
+        """
+        where = ["post_date >= ?"]
+        args: List[Any] = [self._since(days)]
+        if league:
+            where.append("league = ?")
+            args.append(league.upper())
+        if group:
+            where.append("grp = ?")
+            args.append(group)
+        if team:
+            resolver = get_team_resolver(league or "NBA")
+            abbr = resolver.exact(team) if resolver else None
+            if abbr:
+                where.append("(home_abbr = ? OR away_abbr = ?)")
+                args += [abbr, abbr]
+            else:
+                # No resolver for this league (or no match): abbreviation or part of a name
+                name = f"%{team.strip()}%"
+                where.append("(home_abbr = ? OR away_abbr = ? OR home_team LIKE ? OR away_team LIKE ?)")
+                args += [team.strip().upper(), team.strip().upper(), name, name]
+
+        with self._lock:
+            conn = self._connect()
+            if player:
+                exact = self._query(conn, where + ["player = ?"], args + [player.strip()], limit)
+                if exact[1]:
+                    return exact
+                return self._query(conn, where + ["player LIKE ?"], args + [f"%{player.strip()}%"], limit)
+            return self._query(conn, where, args, limit)
+
+    @staticmethod
+    def _query(conn: sqlite3.Connection, where: List[str], args: List[Any], limit: int):
+        clause = " AND ".join(where)
+        total = conn.execute(f"SELECT COUNT(*) FROM picks WHERE {clause}", args).fetchone()[0]
+        rows = conn.execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM picks WHERE {clause} "
+            f"ORDER BY post_date DESC, id DESC LIMIT ?",
+            args + [limit],
+        ).fetchall()
+        return [dict(r) for r in rows], total
+
+    def summary(
+        self,
+        league: str | None = None,
+        days: int = 30,
+        group: str | None = None,
+    ) -> Dict[str, Any]:
+        """Pick count / average hit rate / average odds from the daily rollups only."""
+        where = ["post_date >= ?"]
+        args: List[Any] = [self._since(days)]
+        if league:
+            where.append("league = ?")
+            args.append(league.upper())
+        if group:
+            where.append("grp = ?")
+            args.append(group)
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT COALESCE(SUM(picks), 0), COALESCE(SUM(hit_rate_sum), 0), "
+                "COALESCE(SUM(hit_rate_n), 0), COALESCE(SUM(odds_sum), 0), "
+                "COALESCE(SUM(odds_n), 0), COUNT(DISTINCT post_date) "
+                f"FROM daily_rollups WHERE {' AND '.join(where)}",
+                args,
+            ).fetchone()
+        picks, hr_sum, hr_n, odds_sum, odds_n, active_days = row
+        return {
+            "picks": picks,
+            "days": active_days,
+            "avg_hit_rate": (hr_sum / hr_n) if hr_n else None,
+            "avg_odds": (odds_sum / odds_n) if odds_n else None,
+        }
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            conn = self._connect()
+            # Rows are never deleted, so the last id is the row count (no scan)
+            picks = conn.execute("SELECT COALESCE(MAX(id), 0) FROM picks").fetchone()[0]
+            rollups = conn.execute("SELECT COUNT(*) FROM daily_rollups").fetchone()[0]
+        return {"picks": picks, "rollups": rollups}
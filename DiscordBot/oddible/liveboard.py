@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import discord
+
+from .snapshots import JsonFileStore
+
+# One planned Discord message: (content, embeds, signature). The signature
+# identifies what the message shows (text + pick fingerprints), so two plans
+# with the same signature would render the same message.
+PlannedMessage = Tuple[Optional[str], List[discord.Embed], tuple]
+
+
+def signature_digest(signature: tuple) -> str:
+    return hashlib.sha1(repr(signature).encode("utf-8")).hexdigest()[:20]
+
+
+class LiveBoardStore(JsonFileStore):
+    """
+    The messages each live board is made of, per (channel_id, league_label):
+    [(message_id, signature_digest), ...] in channel order. Persisted so
+    boards keep being edited in place after a restart.
+    """
+
+    def __init__(self, path: Path | str):
+        super().__init__(path)
+        self._boards: Dict[Tuple[int, str], List[Tuple[int, str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._boards)
+
+    def boards(self) -> List[Tuple[int, str]]:
+        """(channel_id, league_label) of every tracked board."""
+        return list(self._boards)
+
+    def get(self, channel_id: int, league_label: str) -> List[Tuple[int, str]]:
+        return self._boards.get((channel_id, league_label), [])
+
+    def set(self, channel_id: int, league_label: str, messages: List[Tuple[int, str]]):
+        if messages:
+            self._boards[(channel_id, league_label)] = messages
+        else:
+            self._boards.pop((channel_id, league_label), None)
+
+    def snapshot(self) -> list:
+        return [
+            {"channel_id": channel_id, "league": league, "messages": list(messages)}
+            for (channel_id, league), messages in self._boards.items()
+        ]
+
+    def _from_record(self, raw: list):
+        self._boards = {
+            (int(b["channel_id"]), str(b["league"])): [(int(mid), str(sig)) for mid, sig in b["messages"]]
+            for b in raw
+        }
+
+
+async def update_live_board(
+    channel: discord.abc.Messageable,
+    channel_id: int,
+    league_label: str,
+    messages: Sequence[PlannedMessage],
+    store: LiveBoardStore,
+) -> Dict[str, int]:
+    """
+    Bring the board for (channel, league) in line with `messages`.
+
+    Message i is only edited if its signature changed; unchanged messages
+    cost no API calls. Extra new messages are sent, leftover old ones are
+    deleted. If an old message has gone missing (deleted by a mod, no
+    access), the board from that point on is re-sent.
+    Returns counts: {"sent", "edited", "unchanged", "deleted"}.
+    """
+    counts = {"sent": 0, "edited": 0, "unchanged": 0, "deleted": 0}
+    previous = store.get(channel_id, league_label)
+    current: List[Tuple[int, str]] = []
+
+    i = 0
+    while i < len(messages) and i < len(previous):
+        content, embeds, signature = messages[i]
+        digest = signature_digest(signature)
+        message_id, old_digest = previous[i]
+        if digest == old_digest:
+            counts["unchanged"] += 1
+            current.append((message_id, digest))
+            i += 1
+            continue
+        try:
+            await channel.get_partial_message(message_id).edit(content=content, embeds=embeds)
+        except discord.HTTPException:
+            break  # gone or not ours any more: re-send from here
+        counts["edited"] += 1
+        current.append((message_id, digest))
+        i += 1
+
+    # Old messages past this point are either surplus or being replaced
+    for message_id, _ in previous[i:]:
+        try:
+            await channel.get_partial_message(message_id).delete()
+            counts["deleted"] += 1
+        except discord.HTTPException:
+            pass
+
+    for content, embeds, signature in messages[i:]:
+        sent = await channel.send(content=content, embeds=embeds)
+        counts["sent"] += 1
+        current.append((sent.id, signature_digest(signature)))
+
+    store.set(channel_id, league_label, current)
+    return counts
@@ -1,31 +1,49 @@
 from __future__ import annotations
 
+import asyncio
+import itertools
 import os
+import sqlite3
+import time
 from pathlib import Path
-from typing import List, Dict, Any, Tuple, Union
+from typing import List, Dict, Any, Iterable, Iterator, Sequence, Tuple, Union
 
 import discord
 from discord import app_commands
 from discord.ext import commands, tasks
 from dotenv import load_dotenv
-import requests
-from requests.exceptions import RequestException, ReadTimeout, ConnectionError as ReqConnectionError
 
 import datetime
 import pytz
 from enum import Enum
 
 from .books import validate_books, prioritize_deeplink_books
+from .cache import TTLCache, payload_key
+from .client import OddibleClient
+from .destinations import DestinationRegistry
+from .ledger import PickLedger, row_as_pick
+from .liveboard import LiveBoardStore, PlannedMessage, update_live_board
+from .packing import iter_packed_embeds, pack_embed_blocks
+from .polling import AdaptivePoller, board_content_hash, next_commence
+from .quota import QuotaTracker
+from .regions import DEFAULT_STATE, UserStateStore, normalize_state
+from .resilience import CircuitBreaker
+from .singleflight import SingleFlight
+from .snapshots import SnapshotStore
 from .utils import (
-    dedupe_and_diversify,
-    group_picks_by_type,
-    select_group_picks,
     format_pick_line,
-    parse_deeplinks,
+    iter_board,
+    pick_deeplinks,
+    pick_fingerprint,
+    select_board,
     format_deeplink_block,
     GROUP_COLOURS,
     GROUP_LABELS,
     GROUP_ORDER,
+    Pick,
+    adopt_picks,
+    deeplink_markdown,
+    slice_response,
 )
 
 # ---------------- Env & API setup (same idea as test bot) ----------------
@@ -39,20 +57,97 @@ if not ODDIBLE_API_KEY:
     # Same behaviour as your test bot: fail loudly so you notice config issue.
     raise RuntimeError("ODDIBLE_API_KEY is not set in DiscordBot/token.env")
 
-ODDIBLE_URL = "https://api.dev.smartbettor.ai/api/oddible/trending"
-HEADERS = {
-    "Content-Type": "application/json",
-    "X-API-Key": ODDIBLE_API_KEY,
-}
+# Point this at a local stand-in (python -m oddible.offline.server) to run offline
+ODDIBLE_URL = os.getenv("ODDIBLE_URL", "https://api.dev.smartbettor.ai/api/oddible/trending")
+
+# Parse /trending bodies incrementally (picks decoded + normalised as they arrive)
+ODDIBLE_STREAMING = os.getenv("ODDIBLE_STREAMING", "1") == "1"
+
+# Response cache: trending picks barely move minute to minute
+ODDIBLE_CACHE_TTL = float(os.getenv("ODDIBLE_CACHE_TTL", "300"))    # seconds
+ODDIBLE_CACHE_SIZE = int(os.getenv("ODDIBLE_CACHE_SIZE", "64"))     # entries
+# How long past its TTL a response may still be served (marked stale) as a fallback
+ODDIBLE_STALE_MAX_AGE = float(os.getenv("ODDIBLE_STALE_MAX_AGE", "21600"))  # seconds
+# With a stale copy on hand, wait at most this long for upstream before serving it
+ODDIBLE_STALE_GRACE = float(os.getenv("ODDIBLE_STALE_GRACE", "3"))  # seconds
+
+# Rendered pick cards, keyed by pick fingerprint + group + state
+ODDIBLE_EMBED_CACHE_SIZE = int(os.getenv("ODDIBLE_EMBED_CACHE_SIZE", "512"))       # entries
+ODDIBLE_EMBED_CACHE_TTL = float(os.getenv("ODDIBLE_EMBED_CACHE_TTL", "21600"))     # seconds
+
+# Circuit breaker: after N upstream failures in a row, fail fast for a cool-down
+ODDIBLE_BREAKER_FAILURES = int(os.getenv("ODDIBLE_BREAKER_FAILURES", "3"))
+ODDIBLE_BREAKER_COOLDOWN = float(os.getenv("ODDIBLE_BREAKER_COOLDOWN", "60"))  # seconds
+
+# Request budget per API key. Oddible's rate-limit headers win when sent;
+# otherwise requests are counted against BUDGET per WINDOW (0 = no limit).
+# The last RESERVE requests are kept for the scheduled auto-post: ad-hoc
+# commands get cached/stale picks (or a "try later") once it's reached.
+ODDIBLE_QUOTA_BUDGET = int(os.getenv("ODDIBLE_QUOTA_BUDGET", "0"))          # requests
+ODDIBLE_QUOTA_WINDOW = float(os.getenv("ODDIBLE_QUOTA_WINDOW", "86400"))    # seconds
+ODDIBLE_QUOTA_RESERVE = int(os.getenv("ODDIBLE_QUOTA_RESERVE", "10"))       # requests
+
+# Last good response per payload is snapshotted here so restarts start warm
+ODDIBLE_SNAPSHOT_DIR = Path(os.getenv("ODDIBLE_SNAPSHOT_DIR", BASE_DIR / "data" / "oddible"))
+
+# Every posted pick is appended here (SQLite) for /pickhistory
+ODDIBLE_LEDGER_PATH = Path(os.getenv("ODDIBLE_LEDGER_PATH", ODDIBLE_SNAPSHOT_DIR / "ledger.sqlite3"))
+
+# Live boards: edit the last posted board in place instead of posting a new one
+ODDIBLE_LIVE_BOARDS = os.getenv("ODDIBLE_LIVE_BOARDS", "0") == "1"
+
+# Live refresh: re-poll leagues with a live board in the background and edit
+# the board when its picks change. Polls every FAST seconds close to game
+# time, NORMAL otherwise, SLOW overnight; identical responses back off.
+ODDIBLE_LIVE_REFRESH = os.getenv("ODDIBLE_LIVE_REFRESH", "0") == "1"
+ODDIBLE_REFRESH_FAST = float(os.getenv("ODDIBLE_REFRESH_FAST", "120"))      # seconds
+ODDIBLE_REFRESH_NORMAL = float(os.getenv("ODDIBLE_REFRESH_NORMAL", "600"))  # seconds
+ODDIBLE_REFRESH_SLOW = float(os.getenv("ODDIBLE_REFRESH_SLOW", "3600"))     # seconds
+# How often the refresher checks which leagues are due
+ODDIBLE_REFRESH_TICK = float(os.getenv("ODDIBLE_REFRESH_TICK", "30"))       # seconds
+
+# Synthetic response header used to flag a result served from the stale cache
+STALE_HEADER = "X-Oddible-Cache"
 
 # Validate & prioritise books once (same list you used in the test bot)
 requested_books = ["draftkings", "fanduel", "betmgm", "prizepicks", "underdog", "novig"]
 books = validate_books(requested_books)
 books = prioritize_deeplink_books(books, max_n=6)
 
+# What the daily auto-post publishes, in channel order: (label, leagues, player_props)
+AUTOPOST_LEAGUES: List[Tuple[str, List[str], bool | None]] = [
+    ("NBA", ["NBA"], None),
+    ("NFL", ["NFL"], None),
+    ("NBA Player Props", ["NBA"], True),
+]
+# Max concurrent upstream fetches during the auto-post
+AUTOPOST_CONCURRENCY = 3
+# Picks asked for per auto-posted board
+AUTOPOST_NUM_PICKS = 20
+# Batched auto-post: one /trending call for all auto-posted boards with the
+# same player_props (so props boards get their own), split locally per board
+# (boards that can't be split, or come out short, are fetched on their own)
+ODDIBLE_BATCHED_FETCH = os.getenv("ODDIBLE_BATCHED_FETCH", "0") == "1"
+# Max destinations being posted to at once. discord.py already waits out
+# per-route 429s; the cap keeps a fan-out well under the global rate limit.
+AUTOPOST_FANOUT_CONCURRENCY = int(os.getenv("ODDIBLE_FANOUT_CONCURRENCY", "4"))
+
+# Pre-fetch auto-posted leagues this many minutes before post time, retrying
+# failed fetches with exponential backoff (seconds, doubling each attempt)
+ODDIBLE_PREWARM_LEAD = int(os.getenv("ODDIBLE_PREWARM_LEAD", "10"))  # minutes
+ODDIBLE_PREWARM_RETRIES = int(os.getenv("ODDIBLE_PREWARM_RETRIES", "4"))
+ODDIBLE_PREWARM_BACKOFF = float(os.getenv("ODDIBLE_PREWARM_BACKOFF", "15"))  # seconds
+
 # ---TIME SETUP ----
 
 halifax_tz = pytz.timezone("America/Halifax")
+DEFAULT_AUTOPOST_TIME = datetime.time(hour=18, minute=0, tzinfo=halifax_tz)  # 6 PM
+
+
+def prewarm_time_for(post_time: datetime.time, lead_minutes: int = ODDIBLE_PREWARM_LEAD) -> datetime.time:
+    """Time of day `lead_minutes` before `post_time` (wraps past midnight)."""
+    anchor = datetime.datetime.combine(datetime.date(2000, 1, 2), post_time.replace(tzinfo=None))
+    return (anchor - datetime.timedelta(minutes=lead_minutes)).time().replace(tzinfo=post_time.tzinfo)
 
 
 class Meridiem(Enum):
@@ -65,47 +160,25 @@ class AutoPostState(Enum):
     OFF = "Off"
 
 
-# ---------------- Core HTTP + helpers (ported from test bot) ----------------
+class OddibleBoard(Enum):
+    NBA = "NBA"
+    NFL = "NFL"
+    NBA_PROPS = "NBA Player Props"
 
-def fetch_trending(
-    leagues: List[str],
-    num_picks: int = 20,
-    risk: str = "moderate",
-    sportsbooks: List[str] | None = None,
-    player_props: bool | None = None,
-) -> Tuple[int, Dict[str, Any], Dict[str, Any]]:
-    """
-    Call Oddible's /trending endpoint and return (status_code, headers, json_data).
-    Mirrors the logic from Testing/Oddible/bot.py.
-    """
-    payload: Dict[str, Any] = {
-        "leagues": leagues,
-        "num_picks": num_picks,
-        "sportsbooks": sportsbooks or ["draftkings"],
-        "risk": risk,
-    }
-    if player_props is not None:
-        payload["player_props"] = bool(player_props)
-
-    try:
-        resp = requests.post(ODDIBLE_URL, json=payload, headers=HEADERS, timeout=20)
-        try:
-            data = resp.json()
-        except Exception:
-            data = {"status": "error", "raw": resp.text}
-        return resp.status_code, dict(resp.headers), data
 
-    except ReadTimeout:
-        return 0, {}, {
-            "status": "timeout",
-            "message": "Request to Oddible timed out. The API may be slow or unavailable.",
-        }
-    except (ReqConnectionError, RequestException) as e:
-        return 0, {}, {
-            "status": "error",
-            "message": f"Network error talking to Oddible: {e}",
-        }
+# What each board asks Oddible for: (leagues, player_props)
+BOARD_QUERIES: Dict[OddibleBoard, Tuple[List[str], bool | None]] = {
+    OddibleBoard.NBA: (["NBA"], None),
+    OddibleBoard.NFL: (["NFL"], None),
+    OddibleBoard.NBA_PROPS: (["NBA"], True),
+}
+# Same, by board label (what live boards are tracked under)
+LABEL_QUERIES: Dict[str, Tuple[List[str], bool | None]] = {
+    board.value: query for board, query in BOARD_QUERIES.items()
+}
+
 
+# ---------------- Embed helpers (ported from test bot) ----------------
 
 def build_oddible_promo_embed() -> discord.Embed:
     """
@@ -157,11 +230,30 @@ async def send_long_message(ctx: commands.Context, content: str):
     await ctx.send(embed=promo_embed)
 
 
-def build_pick_embed(p: dict, group_name: str, state: str = "ny") -> discord.Embed:
+# The same picks come back across !nba calls and auto-posts, so finished
+# cards are kept as embed payloads and rebuilt with Embed.from_dict().
+EMBED_CACHE = TTLCache(ttl=ODDIBLE_EMBED_CACHE_TTL, max_entries=ODDIBLE_EMBED_CACHE_SIZE)
+RENDER_STATS = {"renders": 0, "render_seconds": 0.0}
+
+
+def build_pick_embed(p: Pick, group_name: str, state: str = "ny") -> discord.Embed:
     """
     Turn a single Oddible pick into a card-style embed.
-    Uses utils.format_pick_line() + multi-book deeplinks.
+    Served from EMBED_CACHE when this exact pick was rendered before.
     """
+    key = (pick_fingerprint(p), group_name, state)
+    payload = EMBED_CACHE.get(key)
+    if payload is None:
+        started = time.perf_counter()
+        payload = _render_pick_embed(p, group_name, state).to_dict()
+        RENDER_STATS["renders"] += 1
+        RENDER_STATS["render_seconds"] += time.perf_counter() - started
+        EMBED_CACHE.set(key, payload)
+    return discord.Embed.from_dict(payload)
+
+
+def _render_pick_embed(p: Pick, group_name: str, state: str) -> discord.Embed:
+    """Build the card from scratch: utils.format_pick_line() + multi-book deeplinks."""
     line = format_pick_line(p)
     parts = line.split("\n", 1)
     header = parts[0]
@@ -176,7 +268,7 @@ def build_pick_embed(p: dict, group_name: str, state: str = "ny") -> discord.Emb
         desc_lines.append(rest.strip())
 
     # Deep links (multiple books, ordered by DEEPLINK_PRIORITY)
-    deep_links = parse_deeplinks(p.get("deepLinks", ""))
+    deep_links = pick_deeplinks(p)
     deeplink_block = format_deeplink_block(deep_links, state=state, max_books=3)
     if deeplink_block:
         desc_lines.append(deeplink_block)
@@ -205,26 +297,13 @@ def build_grouped_pick_embeds(
       { "spread": [embed1, embed2, ...], "totals": [...], ... }
     where each embed is a single pick card.
     """
-    data = raw_json.get("data") or {}
-    picks = data.get("picks") or []
-    if not picks:
-        return {}
-
-    # Global dedupe first
-    deduped = dedupe_and_diversify(picks, max_out=len(picks))
-
-    # Bucket by type (spread / totals / moneyline / player_props / other)
-    groups = group_picks_by_type(deduped)
+    # Global dedupe, bucket by type, group-specific selection & cap per group
+    board = select_board(raw_json, max_per_group=max_per_group)
 
     grouped_embeds: Dict[str, List[discord.Embed]] = {}
 
     for gkey in GROUP_ORDER:
-        bucket = groups.get(gkey, [])
-        if not bucket:
-            continue
-
-        # Apply group-specific selection rules & cap per group
-        bucket = select_group_picks(gkey, bucket, max_per_group)
+        bucket = board.get(gkey)
         if not bucket:
             continue
 
@@ -235,50 +314,172 @@ def build_grouped_pick_embeds(
     return grouped_embeds
 
 
-async def send_trending_as_embeds(
-    dest: Union[commands.Context, discord.abc.Messageable],
+def _top_line(league_label: str, stale_age: float | None = None) -> str:
+    """The "Top insights..." text line (plus a note if the data is stale)."""
+    # Top header text (like Outlier's "Top insights for ..." line)
+    top_line = f"Top insights 📈 for **{league_label}** tonight 👇"
+    if stale_age is not None:
+        minutes = max(1, int(stale_age // 60))
+        top_line += (
+            f"\n⏳ Oddible is slow right now — showing the last picks we got "
+            f"(~{minutes} min old). Fresh picks are on the way."
+        )
+    return top_line
+
+
+def _iter_board_blocks(
+    raw_json: dict,
+    state: str,
+    keys: Dict[int, tuple],
+) -> Iterator[List[discord.Embed]]:
+    """
+    Header embed + pick embeds per group, in GROUP_ORDER, then the promo
+    card. Each group is selected and rendered only when it's asked for.
+    `keys` collects id(embed) -> what it shows, for message signatures.
+    """
+    # Global dedupe, bucket by type, group-specific selection & cap per group
+    for gkey, bucket in iter_board(raw_json, max_per_group=3):
+        header_title = GROUP_LABELS.get(gkey, gkey.title())
+        header_colour = GROUP_COLOURS.get(gkey, discord.Colour.blurple())
+
+        header_embed = discord.Embed(
+            title=header_title,
+            description="",
+            colour=header_colour,
+        )
+        keys[id(header_embed)] = ("header", gkey)
+
+        block = [header_embed]
+        for p in bucket:
+            embed = build_pick_embed(p, gkey, state=state)
+            keys[id(embed)] = (pick_fingerprint(p), gkey, state)
+            block.append(embed)
+        yield block
+
+    # Bottom promo card after all groups
+    promo_embed = build_oddible_promo_embed()
+    keys[id(promo_embed)] = ("promo",)
+    yield [promo_embed]
+
+
+def _no_picks_message(league_label: str) -> PlannedMessage:
+    content = f"No picks available for **{league_label}** right now."
+    return content, [], (content,)
+
+
+def build_trending_messages(
     league_label: str,
     raw_json: dict,
     state: str = "ny",
-):
+    stale_age: float | None = None,
+) -> Tuple[List[PlannedMessage], int]:
     """
-    Send the grouped embeds exactly like your test bot:
-    - One text line: "Top insights..."
-    - For each group: header embed + pick embeds in one message
+    Lay out a trending board the same way as your test bot:
+    - One text line: "Top insights..." (plus a note if the data is stale)
+    - For each group: header embed + pick embeds
     - Then the Oddible promo embed.
+    Everything is packed into as few messages as Discord's limits allow
+    (the text line rides on the first one, a header stays with its picks).
 
-    `dest` can be a commands.Context or any channel-like object with .send().
+    Returns ([(content, embeds, signature), ...], unpacked_message_count).
+    A message's signature is its text plus the fingerprints of its picks.
     """
-    grouped = build_grouped_pick_embeds(raw_json, max_per_group=3, state=state)
+    keys: Dict[int, tuple] = {}  # id(embed) -> what it shows
+    blocks = list(_iter_board_blocks(raw_json, state, keys))
+    if len(blocks) == 1:  # just the promo
+        return [_no_picks_message(league_label)], 1
+
+    top_line = _top_line(league_label, stale_age)
+    messages: List[PlannedMessage] = []
+    for i, embeds in enumerate(pack_embed_blocks(blocks)):
+        content = top_line if i == 0 else None
+        messages.append((content, embeds, (content, tuple(keys[id(e)] for e in embeds))))
+
+    # Unpacked: text line + one message per group + promo
+    return messages, 1 + len(blocks)
 
-    if not grouped:
-        await dest.send(f"No picks available for **{league_label}** right now.")
+
+def iter_trending_messages(
+    league_label: str,
+    raw_json: dict,
+    state: str = "ny",
+    stale_age: float | None = None,
+) -> Iterator[PlannedMessage]:
+    """
+    build_trending_messages() for posting as it renders: groups are
+    selected, rendered and packed lazily, so each message (the first one
+    carrying the text line) goes out as soon as it's full, while the rest
+    is still being built. Same messages as build_trending_messages().
+    """
+    keys: Dict[int, tuple] = {}
+    blocks = _iter_board_blocks(raw_json, state, keys)
+    first = next(blocks)
+    if keys[id(first[0])] == ("promo",):
+        yield _no_picks_message(league_label)
         return
 
-    # Top header text (like Outlier's "Top insights for ..." line)
-    await dest.send(f"Top insights 📈 for **{league_label}** tonight 👇")
+    top_line = _top_line(league_label, stale_age)
+    for i, embeds in enumerate(iter_packed_embeds(itertools.chain([first], blocks))):
+        content = top_line if i == 0 else None
+        yield content, embeds, (content, tuple(keys[id(e)] for e in embeds))
 
-    # For each group, send a header embed + its pick embeds (all in one message)
-    for gkey in GROUP_ORDER:
-        embeds_for_group = grouped.get(gkey)
-        if not embeds_for_group:
-            continue
 
-        header_title = GROUP_LABELS.get(gkey, gkey.title())
-        header_colour = GROUP_COLOURS.get(gkey, discord.Colour.blurple())
+def unpacked_message_count(messages: Sequence[PlannedMessage]) -> int:
+    """Messages a board would take unpacked: text line + one per group + promo."""
+    parts = 1
+    for _, _, signature in messages:
+        embed_keys = signature[1] if len(signature) > 1 else ()
+        parts += sum(1 for k in embed_keys if k[0] in ("header", "promo"))
+    return parts
 
-        header_embed = discord.Embed(
-            title=header_title,
-            description="",
-            colour=header_colour,
-        )
 
-        await dest.send(embeds=[header_embed] + embeds_for_group)
+async def send_trending_as_embeds(
+    dest: Union[commands.Context, discord.abc.Messageable],
+    league_label: str,
+    raw_json: dict,
+    state: str = "ny",
+    stale_age: float | None = None,
+    placeholder: discord.Message | None = None,
+) -> Tuple[int, int]:
+    """
+    Post a trending board (see build_trending_messages) as new messages,
+    each one as soon as it's rendered (iter_trending_messages).
+
+    `dest` can be a commands.Context or any channel-like object with .send().
+    A `placeholder` message (e.g. "Fetching...") is edited into the first
+    message instead of being left behind.
+    Returns (messages_sent, messages_saved) vs. one message per part.
+    """
+    messages = iter_trending_messages(league_label, raw_json, state=state, stale_age=stale_age)
+    sent, posted = await send_planned_messages(dest, messages, placeholder=placeholder)
+    return sent, unpacked_message_count(posted) - len(posted)
 
-    # After sending all groups, send the bottom promo card
-    promo_embed = build_oddible_promo_embed()
-    await dest.send(embed=promo_embed)
 
+async def send_planned_messages(
+    dest: Union[commands.Context, discord.abc.Messageable],
+    messages: Iterable[PlannedMessage],
+    placeholder: discord.Message | None = None,
+) -> Tuple[int, List[PlannedMessage]]:
+    """
+    Send planned messages in order, each as soon as `messages` yields it.
+    The first one is edited into `placeholder` when there is one (and it
+    still exists). Returns (new_messages_sent, messages_posted).
+    """
+    posted: List[PlannedMessage] = []
+    sent = 0
+    for message in messages:
+        content, embeds, _ = message
+        if not posted and placeholder is not None:
+            try:
+                await placeholder.edit(content=content, embeds=embeds)
+                posted.append(message)
+                continue
+            except discord.HTTPException:
+                pass  # deleted in the meantime: send it as a new message
+        await dest.send(content=content, embeds=embeds)
+        posted.append(message)
+        sent += 1
+    return sent, posted
 
 
 # ---------------- Cog wrapper around that logic ----------------
@@ -294,40 +495,372 @@ class OddibleCog(commands.Cog):
         # reuse validated/prioritised books
         self.books = books
 
-        # Auto-post state
+        # One pooled, non-blocking HTTP client for the cog's lifetime
+        self.client = OddibleClient(ODDIBLE_URL, ODDIBLE_API_KEY)
+
+        # Successful /trending responses, keyed on the normalised payload
+        self.cache = TTLCache(
+            ttl=ODDIBLE_CACHE_TTL,
+            max_entries=ODDIBLE_CACHE_SIZE,
+            max_stale=ODDIBLE_STALE_MAX_AGE,
+        )
+
+        # On-disk copy of the cache, reloaded on startup
+        self.snapshots = SnapshotStore(ODDIBLE_SNAPSHOT_DIR)
+
+        # Concurrent callers for an identical payload share one upstream request
+        self.inflight = SingleFlight()
+
+        # Fail fast while Oddible is down; background refreshes live here
+        self.breaker = CircuitBreaker(
+            failure_threshold=ODDIBLE_BREAKER_FAILURES,
+            cooldown=ODDIBLE_BREAKER_COOLDOWN,
+        )
+        self._background: set[asyncio.Task] = set()
+        self.stale_served = 0
+
+        # Upstream request budget; commands yield to the auto-post near zero
+        self.quota = QuotaTracker(
+            api_key=ODDIBLE_API_KEY,
+            budget=ODDIBLE_QUOTA_BUDGET,
+            window=ODDIBLE_QUOTA_WINDOW,
+            reserve=ODDIBLE_QUOTA_RESERVE,
+        )
+        # Message packing: posts published, messages sent, REST calls saved;
+        # live boards: messages edited in place / left untouched
+        self.post_stats = {"posts": 0, "messages": 0, "saved": 0, "edited": 0, "unchanged": 0}
+
+        # Live boards: message IDs per (channel, league), edited in place
+        self.live_boards_enabled: bool = ODDIBLE_LIVE_BOARDS
+        self.live_boards = LiveBoardStore(ODDIBLE_SNAPSHOT_DIR / "live_boards.json")
+
+        # Live refresh: per-league poll schedule for the tracked boards
+        self.live_refresh_enabled: bool = ODDIBLE_LIVE_REFRESH
+        self.poller = AdaptivePoller(
+            fast=ODDIBLE_REFRESH_FAST,
+            normal=ODDIBLE_REFRESH_NORMAL,
+            slow=ODDIBLE_REFRESH_SLOW,
+            max_interval=ODDIBLE_REFRESH_SLOW,
+            tz=halifax_tz,
+        )
+
+        # Pre-warmed auto-post results: payload key -> (fetched_at, result)
+        self._warm: Dict[tuple, Tuple[float, Tuple[int, Dict[str, Any], Dict[str, Any]]]] = {}
+
+        # Auto-post state: every destination gets the same boards, rendered
+        # with its own deeplink region
         self.autopost_enabled: bool = False
-        self.autopost_channel_id: int | None = None
+        self.destinations = DestinationRegistry(ODDIBLE_SNAPSHOT_DIR / "autopost_destinations.json")
+
+        # History of posted picks, bucketed into Halifax days like the schedule
+        self.ledger = PickLedger(ODDIBLE_LEDGER_PATH, tz=halifax_tz)
+
+        # Members' deeplink states for their personal (ephemeral) boards
+        self.user_states = UserStateStore(ODDIBLE_SNAPSHOT_DIR / "user_states.json")
 
-        # Start the auto-post loop (it no-ops until enabled)
+        # Start the auto-post + pre-warm + live refresh loops (they no-op until enabled)
         try:
             self.autopost_loop.start()
         except RuntimeError:
             pass
+        try:
+            self.prewarm_loop.start()
+        except RuntimeError:
+            pass
+        try:
+            self.live_refresh_loop.start()
+        except RuntimeError:
+            pass
+
+    async def cog_load(self):
+        # Live board message IDs survive restarts so boards keep being edited
+        await asyncio.to_thread(self.live_boards.load)
+        await asyncio.to_thread(self.destinations.load)
+        await asyncio.to_thread(self.user_states.load)
+
+        # Reload the last good responses so the first commands after a
+        # restart are served straight away (stale-while-revalidate kicks in
+        # for anything past its TTL).
+        try:
+            entries = await asyncio.to_thread(
+                self.snapshots.load_all,
+                ODDIBLE_CACHE_TTL + ODDIBLE_STALE_MAX_AGE,
+            )
+        except OSError as e:
+            print(f"❗ Could not load Oddible snapshots: {e}")
+            return
+        for key, stored_at, result in entries:
+            self.cache.set(key, result, stored_at=stored_at)
+
+    async def cog_unload(self):
+        self.autopost_loop.cancel()
+        self.prewarm_loop.cancel()
+        self.live_refresh_loop.cancel()
+        for task in self._background:
+            task.cancel()
+        await self.client.close()
+        await asyncio.to_thread(self.ledger.close)
 
     # ---------------- Core helpers ----------------
 
+    async def _fetch_trending(
+        self,
+        leagues: List[str],
+        player_props: bool | None = None,
+        num_picks: int = 20,
+        risk: str = "moderate",
+        priority: str = QuotaTracker.HIGH,
+    ) -> Tuple[int, Dict[str, Any], Dict[str, Any]]:
+        """
+        fetch_trending() with the response cache in front of it.
+
+        - fresh cache hit → returned straight away
+        - expired but within the stale window → give upstream ODDIBLE_STALE_GRACE
+          seconds (none if it has been failing); if it's slower than that or
+          errors, return the stale copy marked via STALE_HEADER and let the
+          refresh finish in the background
+        - low-priority caller (commands) and the quota is down to its
+          reserve → stale copy if we have one, otherwise "try later"
+        - circuit open → stale copy if we have one, otherwise fail fast
+        - otherwise → one upstream call, shared by identical concurrent callers
+        """
+        key = self._payload_key(leagues, player_props, num_picks, risk)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        def _fetch():
+            return self._fetch_upstream(key, leagues, player_props, num_picks, risk)
+
+        stale = self.cache.get_stale(key)
+
+        # Quota nearly spent: ad-hoc requests make do with what we have.
+        # Checked before the breaker, which hands out its half-open probe
+        # slot in allow() and needs that probe to actually go upstream.
+        if key not in self.inflight and not self.quota.allow(priority):
+            if stale is not None:
+                return self._mark_stale(*stale)
+            wait = max(1, round(self.quota.reset_in() / 60))
+            wait_text = f"{wait} min" if wait < 120 else f"{round(wait / 60)} h"
+            return 0, {}, {
+                "status": "unavailable",
+                "message": "Oddible request budget is nearly used up (saving it for the scheduled "
+                           f"posts). Try again in ~{wait_text}.",
+            }
+
+        # Nobody is fetching this payload yet and the circuit is open: fail fast
+        if key not in self.inflight and not self.breaker.allow():
+            if stale is not None:
+                return self._mark_stale(*stale)
+            wait = int(self.breaker.retry_after()) or 1
+            return 0, {}, {
+                "status": "unavailable",
+                "message": f"Oddible is having trouble right now. Try again in ~{wait}s.",
+            }
+
+        task = asyncio.ensure_future(self.inflight.do(key, _fetch))
+        if stale is None:
+            return await task
+
+        # Stale-while-revalidate: refresh, but don't make anyone wait out a
+        # slow upstream when we already have something to show.
+        grace = ODDIBLE_STALE_GRACE if self.breaker.failures == 0 else 0
+        done, _ = await asyncio.wait({task}, timeout=grace)
+        if task in done and not task.cancelled() and not task.exception() \
+                and task.result()[0] == 200:
+            return task.result()
+        if task not in done:
+            self._track(task)
+        return self._mark_stale(*stale)
+
+    def _track(self, task: asyncio.Future):
+        """Keep a reference to a background task until it finishes."""
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    def _spawn(self, coro) -> asyncio.Task:
+        task = asyncio.ensure_future(coro)
+        self._track(task)
+        return task
+
+    def _save_in_background(self, store):
+        """
+        Persist a LiveBoardStore / DestinationRegistry / UserStateStore
+        without blocking: the record is built here, on the loop thread, so
+        the worker thread never iterates dicts the loop keeps changing.
+        """
+        async def _write(record):
+            try:
+                await asyncio.to_thread(store.save, record)
+            except OSError as e:
+                print(f"❗ Could not write {store.path.name}: {e}")
+
+        self._spawn(_write(store.snapshot()))
+
+    async def _save_snapshot(self, key: tuple, result: Tuple[int, Dict[str, Any], Dict[str, Any]]):
+        try:
+            await asyncio.to_thread(self.snapshots.save, key, result)
+        except OSError as e:
+            print(f"❗ Could not write Oddible snapshot: {e}")
+
+    def _payload_key(
+        self,
+        leagues: List[str],
+        player_props: bool | None = None,
+        num_picks: int = 20,
+        risk: str = "moderate",
+    ) -> tuple:
+        return payload_key(leagues, num_picks, risk, self.books, player_props)
+
+    async def _fetch_upstream(
+        self,
+        key: tuple,
+        leagues: List[str],
+        player_props: bool | None,
+        num_picks: int,
+        risk: str,
+    ) -> Tuple[int, Dict[str, Any], Dict[str, Any]]:
+        """One real /trending call; feeds the circuit breaker and the cache."""
+        # When streaming, each pick becomes a Pick record while the rest of
+        # the body is still downloading, so rendering starts pre-normalised.
+        records: List[Pick] = []
+        try:
+            result = await self.client.fetch_trending(
+                leagues=leagues,
+                num_picks=num_picks,
+                risk=risk,
+                sportsbooks=self.books,
+                player_props=player_props,
+                stream=ODDIBLE_STREAMING,
+                on_pick=(lambda p: records.append(Pick(p))) if ODDIBLE_STREAMING else None,
+            )
+        except Exception:
+            self.quota.record(0)
+            self.breaker.record_failure()
+            raise
+        self.quota.record(result[0], result[1])
+        status, headers, data = result
+        if status == 200 and not (isinstance(data, dict) and isinstance(data.get("data"), dict)):
+            # Unparseable / truncated body: as broken as a 5xx, and it must
+            # not replace the cached copy or snapshot we fall back on
+            result = 0, headers, {
+                "status": "error",
+                "message": "Oddible returned a malformed or truncated response.",
+            }
+        if records and result[0] == 200:
+            adopt_picks(result[2], records)
+        self.breaker.record_result(result[0])
+        if result[0] == 200:
+            self.cache.set(key, result)
+            self._spawn(self._save_snapshot(key, result))
+        return result
+
+    def _mark_stale(
+        self,
+        result: Tuple[int, Dict[str, Any], Dict[str, Any]],
+        age: float,
+    ) -> Tuple[int, Dict[str, Any], Dict[str, Any]]:
+        self.stale_served += 1
+        status, headers, data = result
+        return status, {**headers, STALE_HEADER: "stale", "Age": str(int(age))}, data
+
     async def _post_oddible_to_dest(
         self,
         dest: discord.abc.Messageable,
         league_label: str,
         leagues: List[str],
         player_props: bool | None = None,
+        placeholder: discord.Message | None = None,
     ):
         """Shared logic for prefix commands + auto-post scheduler."""
-        status, headers, data = fetch_trending(
-            leagues=leagues,
-            num_picks=20,
-            risk="moderate",
-            sportsbooks=self.books,
-            player_props=player_props,
-        )
+        result = await self._fetch_trending(leagues, player_props, priority=QuotaTracker.LOW)
+        await self._publish_trending(dest, league_label, result, placeholder=placeholder)
+
+    async def _publish_trending(
+        self,
+        dest: discord.abc.Messageable,
+        league_label: str,
+        result: Tuple[int, Dict[str, Any], Dict[str, Any]],
+        state: str = DEFAULT_STATE,
+        plan: Tuple[List[PlannedMessage], int] | None = None,
+        placeholder: discord.Message | None = None,
+    ) -> int:
+        """
+        Send an already-fetched (status, headers, data) result to dest.
+        `plan` is a build_trending_messages() result to reuse (the auto-post
+        renders each league once per region); otherwise each message is
+        posted as soon as it's rendered. A `placeholder` ("Fetching...")
+        is edited into the first message instead of being left behind.
+        With live boards on, the channel's last board for this league is
+        edited in place instead. Returns how many new messages were sent.
+        """
+        status, headers, data = result
 
         if status != 200:
+            # Leave any live board as it is; just say what went wrong
             msg = data.get("message") or data.get("raw") or f"HTTP {status}"
-            await dest.send(f"⚠️ Oddible error: {msg}")
+            text = f"⚠️ Oddible error: {msg}"
+            sent, _ = await send_planned_messages(dest, [(text, [], (text,))], placeholder=placeholder)
+            return sent
+
+        self.post_stats["posts"] += 1
+        channel = dest.channel if isinstance(dest, commands.Context) else dest
+        self._spawn(self._record_board(channel.id, league_label, data))
+
+        if not self.live_boards_enabled:
+            if plan is None:
+                messages = iter_trending_messages(
+                    league_label, data, state=state, stale_age=self._stale_age(headers),
+                )
+            else:
+                messages = plan[0]
+            sent, posted = await send_planned_messages(dest, messages, placeholder=placeholder)
+            unpacked = plan[1] if plan is not None else unpacked_message_count(posted)
+            self.post_stats["messages"] += sent
+            self.post_stats["saved"] += unpacked - len(posted)
+            return sent
+
+        if plan is None:
+            plan = self._plan_board(league_label, result, state)
+        messages, unpacked = plan
+
+        counts = await update_live_board(channel, channel.id, league_label, messages, self.live_boards)
+        self.post_stats["messages"] += counts["sent"]
+        self.post_stats["saved"] += unpacked - counts["sent"]
+        self.post_stats["edited"] += counts["edited"]
+        self.post_stats["unchanged"] += counts["unchanged"]
+        self._save_in_background(self.live_boards)
+        return counts["sent"]
+
+    async def _record_board(self, channel_id: int, league_label: str, data: Dict[str, Any]):
+        """Append the picks shown on a posted board to the ledger."""
+        board = select_board(data, max_per_group=3)
+        picks = [p for gkey in GROUP_ORDER for p in board.get(gkey, [])]
+        if not picks:
             return
+        try:
+            await asyncio.to_thread(self.ledger.record, channel_id, league_label, picks)
+        except sqlite3.Error as e:
+            print(f"❗ Could not write to the Oddible pick ledger: {e}")
 
-        await send_trending_as_embeds(dest, league_label, data)
+    @staticmethod
+    def _plan_board(
+        league_label: str,
+        result: Tuple[int, Dict[str, Any], Dict[str, Any]],
+        state: str = DEFAULT_STATE,
+    ) -> Tuple[List[PlannedMessage], int]:
+        """Render a successful result into packed messages for one region."""
+        _, headers, data = result
+        return build_trending_messages(
+            league_label, data, state=state, stale_age=OddibleCog._stale_age(headers),
+        )
+
+    @staticmethod
+    def _stale_age(headers: Dict[str, Any]) -> float | None:
+        """Age of a result served from the stale cache (None if it's fresh)."""
+        if headers.get(STALE_HEADER) == "stale":
+            return float(headers.get("Age") or 0)
+        return None
 
     async def _run_oddible_command(
         self,
@@ -342,39 +875,281 @@ class OddibleCog(commands.Cog):
         except (discord.Forbidden, discord.HTTPException):
             pass
 
-        await ctx.send(f"Fetching **{league_label}** picks from Oddible...")
+        if self.live_boards_enabled:
+            # Don't add a "Fetching" line per command; the board is edited in place
+            result = await self._fetch_trending(leagues, player_props, priority=QuotaTracker.LOW)
+            if await self._publish_trending(ctx, league_label, result) == 0:
+                await ctx.send(
+                    f"🔄 Updated the live **{league_label}** board above.",
+                    delete_after=15,
+                )
+            return
+
+        placeholder = await ctx.send(f"Fetching **{league_label}** picks from Oddible...")
 
         await self._post_oddible_to_dest(
             dest=ctx,
             league_label=league_label,
             leagues=leagues,
             player_props=player_props,
+            placeholder=placeholder,
         )
 
     # ---------------- Daily auto-post loop ----------------
 
-    @tasks.loop(time=datetime.time(hour=18, minute=0, tzinfo=halifax_tz))  # default 6 PM
+    @tasks.loop(time=prewarm_time_for(DEFAULT_AUTOPOST_TIME))
+    async def prewarm_loop(self):
+        """
+        Runs ODDIBLE_PREWARM_LEAD minutes before the auto-post.
+        Fetches every auto-posted league so the post itself can publish
+        straight away instead of waiting on Oddible.
+        """
+        if not self.autopost_enabled or not self.destinations:
+            return
+
+        self._warm.clear()
+        limiter = asyncio.Semaphore(AUTOPOST_CONCURRENCY)
+
+        async def _bounded_prewarm(leagues: List[str], player_props: bool | None, num_picks: int):
+            async with limiter:
+                await self._prewarm_one(leagues, player_props, num_picks)
+
+        await asyncio.gather(*(
+            _bounded_prewarm(leagues, player_props, num_picks)
+            for leagues, player_props, num_picks in self._autopost_queries()
+        ))
+
+    async def _prewarm_one(self, leagues: List[str], player_props: bool | None, num_picks: int):
+        """Fetch one query for the warm cache, retrying with backoff."""
+        key = self._payload_key(leagues, player_props, num_picks)
+        delay = ODDIBLE_PREWARM_BACKOFF
+
+        for attempt in range(1, ODDIBLE_PREWARM_RETRIES + 1):
+            result = await self.inflight.do(
+                key,
+                lambda: self._fetch_upstream(key, leagues, player_props, num_picks, "moderate"),
+            )
+            if result[0] == 200:
+                self._warm[key] = (time.time(), result)
+                return
+            if attempt < ODDIBLE_PREWARM_RETRIES:
+                await asyncio.sleep(delay)
+                delay *= 2
+        # Out of retries: autopost_loop will fall back to a live fetch
+
+    def _take_warm(
+        self,
+        leagues: List[str],
+        player_props: bool | None,
+        num_picks: int = AUTOPOST_NUM_PICKS,
+    ) -> Tuple[int, Dict[str, Any], Dict[str, Any]] | None:
+        """Pop a pre-warmed result if it's from this run's pre-warm window."""
+        entry = self._warm.pop(self._payload_key(leagues, player_props, num_picks), None)
+        if entry is None:
+            return None
+        fetched_at, result = entry
+        # Anything older than the lead time (+ slack for retries) is yesterday's
+        if time.time() - fetched_at > (ODDIBLE_PREWARM_LEAD + 15) * 60:
+            return None
+        return result
+
+    @staticmethod
+    def _autopost_queries() -> List[Tuple[List[str], bool | None, int]]:
+        """The (leagues, player_props, num_picks) queries behind the auto-post."""
+        return [query for _, query in OddibleCog._autopost_batches()]
+
+    @staticmethod
+    def _autopost_batches() -> List[Tuple[List[int], Tuple[List[str], bool | None, int]]]:
+        """
+        (AUTOPOST_LEAGUES indices, query) per upstream call. Unbatched, every
+        board is its own query. Batched, boards with the same player_props
+        share one multi-league query with room for each board's share; a
+        props board never rides on a mixed query, where other markets would
+        crowd it out of the pick limit.
+        """
+        if not ODDIBLE_BATCHED_FETCH:
+            return [
+                ([i], (leagues, player_props, AUTOPOST_NUM_PICKS))
+                for i, (_, leagues, player_props) in enumerate(AUTOPOST_LEAGUES)
+            ]
+        by_props: Dict[bool | None, List[int]] = {}
+        for i, (_, _, player_props) in enumerate(AUTOPOST_LEAGUES):
+            by_props.setdefault(player_props, []).append(i)
+        batches = []
+        for player_props, boards in by_props.items():
+            leagues = list(dict.fromkeys(l for i in boards for l in AUTOPOST_LEAGUES[i][1]))
+            batches.append((boards, (leagues, player_props, AUTOPOST_NUM_PICKS * len(boards))))
+        return batches
+
+    async def _fetch_autopost_boards(
+        self,
+    ) -> List[Tuple[int, Dict[str, Any], Dict[str, Any]]]:
+        """
+        One (status, headers, data) result per AUTOPOST_LEAGUES board.
+        Pre-warmed results are used where we have them; the rest are fetched
+        live, concurrently (bounded). Batched, each combined response is split
+        per board; a board is fetched on its own if its picks don't say which
+        league they're from, or if its slice is short of AUTOPOST_NUM_PICKS
+        while the combined response was full (other leagues may have crowded
+        it out of the shared pick limit).
+        Tweak AUTOPOST_LEAGUES to change what gets auto-posted.
+        """
+        limiter = asyncio.Semaphore(AUTOPOST_CONCURRENCY)
+
+        async def _bounded_fetch(leagues: List[str], player_props: bool | None, num_picks: int):
+            warm = self._take_warm(leagues, player_props, num_picks)
+            if warm is not None:
+                return warm
+            async with limiter:
+                return await self._fetch_trending(leagues, player_props, num_picks)
+
+        batches = self._autopost_batches()
+        fetched = await asyncio.gather(*(_bounded_fetch(*query) for _, query in batches))
+
+        results: List[Tuple[int, Dict[str, Any], Dict[str, Any]] | None] = [None] * len(AUTOPOST_LEAGUES)
+        for (boards, (_, _, num_picks)), result in zip(batches, fetched):
+            status, headers, data = result
+            if len(boards) == 1 or status != 200:
+                # A board's own query, or the same error on every board of
+                # the batch, as separate fetches would have shown
+                for i in boards:
+                    results[i] = result
+                continue
+
+            # A combined response with fewer picks than asked for is everything
+            # upstream has, so a short slice is the whole board
+            upstream_full = len((data.get("data") or {}).get("picks") or []) >= num_picks
+            for i in boards:
+                _, leagues, player_props = AUTOPOST_LEAGUES[i]
+                sliced = slice_response(data, leagues[0], player_props) if len(leagues) == 1 else None
+                if sliced is not None and not (upstream_full and len(sliced["data"]["picks"]) < AUTOPOST_NUM_PICKS):
+                    results[i] = (status, headers, sliced)
+
+        missing = [i for i, r in enumerate(results) if r is None]
+        if missing:
+            refetched = await asyncio.gather(*(
+                _bounded_fetch(AUTOPOST_LEAGUES[i][1], AUTOPOST_LEAGUES[i][2], AUTOPOST_NUM_PICKS)
+                for i in missing
+            ))
+            for i, r in zip(missing, refetched):
+                results[i] = r
+        return results
+
+    @tasks.loop(time=DEFAULT_AUTOPOST_TIME)
     async def autopost_loop(self):
         """
         Runs once per day at the scheduled time.
-        If enabled, auto-posts NBA, NFL, and NBA props to the configured channel.
+        If enabled, auto-posts NBA, NFL, and NBA props to every destination.
         """
-        if not self.autopost_enabled or self.autopost_channel_id is None:
+        if not self.autopost_enabled or not self.destinations:
             return
 
-        channel = self.bot.get_channel(self.autopost_channel_id)
-        if channel is None:
+        targets = []
+        for dest in self.destinations.all():
+            channel = self.bot.get_channel(dest.channel_id)
+            if channel is None:
+                print(f"❗ Oddible auto-post channel {dest.channel_id} not found, skipping.")
+                continue
+            targets.append((dest, channel))
+        if not targets:
             return
 
-        # You can tweak which of these you actually want auto-posted
-        await channel.send("Fetching **NBA** picks from Oddible...")
-        await self._post_oddible_to_dest(channel, "NBA", ["NBA"], player_props=None)
+        # One fetch per league (or one for all of them, batched), whatever
+        # the number of destinations.
+        results = await self._fetch_autopost_boards()
+
+        # Render each league once per deeplink region in use
+        states = {dest.state for dest, _ in targets}
+        plans: Dict[Tuple[str, str], Tuple[List[PlannedMessage], int]] = {}
+        for (label, _, _), result in zip(AUTOPOST_LEAGUES, results):
+            if result[0] == 200:
+                for state in states:
+                    plans[(label, state)] = self._plan_board(label, result, state)
+
+        # Fan out: destinations in parallel (capped), each one gets the
+        # leagues in a fixed order so every channel reads like a one-by-one post.
+        sender = asyncio.Semaphore(AUTOPOST_FANOUT_CONCURRENCY)
+
+        async def _post_to(dest, channel):
+            async with sender:
+                # No "Fetching..." placeholder: the boards are already fetched
+                for (label, _, _), result in zip(AUTOPOST_LEAGUES, results):
+                    await self._publish_trending(
+                        channel, label, result,
+                        state=dest.state,
+                        plan=plans.get((label, dest.state)),
+                    )
+
+        outcomes = await asyncio.gather(
+            *(_post_to(dest, channel) for dest, channel in targets),
+            return_exceptions=True,
+        )
+        for (dest, _), outcome in zip(targets, outcomes):
+            if isinstance(outcome, Exception):
+                print(f"❗ Oddible auto-post to {dest.channel_id} failed: {outcome}")
+
+    # ---------------- Live board refresher ----------------
+
+    @tasks.loop(seconds=ODDIBLE_REFRESH_TICK)
+    async def live_refresh_loop(self):
+        """
+        Keeps live boards fresh between posts. Each league with a tracked
+        board is re-fetched when the poller says it's due; boards are only
+        touched when the picks they'd show changed, and then only the
+        messages that differ are edited.
+        """
+        if not (self.live_boards_enabled and self.live_refresh_enabled):
+            return
 
-        await channel.send("Fetching **NFL** picks from Oddible...")
-        await self._post_oddible_to_dest(channel, "NFL", ["NFL"], player_props=None)
+        channels_by_label: Dict[str, List[int]] = {}
+        for channel_id, label in self.live_boards.boards():
+            if label in LABEL_QUERIES:
+                channels_by_label.setdefault(label, []).append(channel_id)
+        self.poller.retain(channels_by_label)
+
+        for label, channel_ids in channels_by_label.items():
+            if self.poller.due(label):
+                await self._refresh_live_boards(label, channel_ids)
+
+    async def _refresh_live_boards(self, label: str, channel_ids: List[int]):
+        """Poll one league and push any change to its live boards."""
+        leagues, player_props = LABEL_QUERIES[label]
+        key = self._payload_key(leagues, player_props)
+
+        # Straight to upstream (the response cache would hide changes), as
+        # low-priority traffic, and not while the circuit is open
+        if not self.quota.allow(QuotaTracker.LOW) or not self.breaker.allow():
+            self.poller.defer(label)
+            return
+        try:
+            result = await self.inflight.do(
+                key,
+                lambda: self._fetch_upstream(key, leagues, player_props, 20, "moderate"),
+            )
+        except Exception as e:
+            print(f"❗ Oddible live refresh for {label} failed: {e}")
+            self.poller.defer(label)
+            return
+        if result[0] != 200:
+            self.poller.defer(label)
+            return
 
-        await channel.send("Fetching **NBA Player Props** from Oddible...")
-        await self._post_oddible_to_dest(channel, "NBA Player Props", ["NBA"], player_props=True)
+        data = result[2]
+        if not self.poller.observe(label, board_content_hash(data), next_commence(data, time.time())):
+            return
+
+        plans: Dict[str, Tuple[List[PlannedMessage], int]] = {}
+        for channel_id in channel_ids:
+            channel = self.bot.get_channel(channel_id)
+            if channel is None:
+                continue
+            state = self.destinations.state_for(channel_id)
+            if state not in plans:
+                plans[state] = self._plan_board(label, result, state)
+            try:
+                await self._publish_trending(channel, label, result, state=state, plan=plans[state])
+            except discord.HTTPException as e:
+                print(f"❗ Oddible live refresh of {label} in {channel_id} failed: {e}")
 
     # ---------------- Slash command: schedule control ----------------
 
@@ -400,7 +1175,9 @@ class OddibleCog(commands.Cog):
         """
         Example:
         /setoddibleschedule hour:6 minute:30 period:PM enabled:On
-        → Auto-post at 6:30 PM Halifax time in this channel.
+        → Auto-post at 6:30 PM Halifax time to every destination. With none
+          set up yet, this channel becomes the first one; otherwise use
+          /addoddibledestination and /removeoddibledestination.
         """
 
         # Validate user input
@@ -438,12 +1215,17 @@ class OddibleCog(commands.Cog):
         if new_time < now:
             new_time += datetime.timedelta(days=1)
 
-        # Update the loop's trigger time (next run + future days)
+        # Update the loop's trigger time (next run + future days),
+        # and move the pre-warm so it still runs ahead of it
         self.autopost_loop.change_interval(time=new_time.timetz())
+        self.prewarm_loop.change_interval(time=prewarm_time_for(new_time.timetz()))
 
-        # Use the channel where the command was run
-        if interaction.channel is not None:
-            self.autopost_channel_id = interaction.channel.id
+        # First-time setup: with no destinations yet, the channel where the
+        # command was run becomes one. Otherwise destinations are left alone.
+        channel_id = interaction.channel.id if interaction.channel is not None else None
+        if channel_id is not None and not self.destinations:
+            self.destinations.add(channel_id)
+            self._save_in_background(self.destinations)
 
         # Toggle ON/OFF
         if enabled == AutoPostState.ON:
@@ -451,7 +1233,7 @@ class OddibleCog(commands.Cog):
             msg = (
                 f"📅 Oddible auto-posting is now **ON**.\n"
                 f"It will run daily at **{hour}:{minute:02d} {period.value}** "
-                f"in <#{self.autopost_channel_id}> (Halifax time)."
+                f"(Halifax time) in {self._destinations_text()}."
             )
         else:
             self.autopost_enabled = False
@@ -463,6 +1245,304 @@ class OddibleCog(commands.Cog):
 
         await interaction.response.send_message(msg, ephemeral=True)
 
+    def _destinations_text(self) -> str:
+        return ", ".join(
+            f"<#{d.channel_id}> ({d.state.upper()})" for d in self.destinations.all()
+        ) or "no channels yet"
+
+    # ---------------- Slash commands: auto-post destinations ----------------
+
+    @app_commands.command(
+        name="addoddibledestination",
+        description="Add a channel to the Oddible auto-post, with its deeplink state. (Admins only)",
+    )
+    @app_commands.checks.has_permissions(administrator=True)
+    @app_commands.describe(
+        channel="Channel to post in (defaults to this one)",
+        state="Two-letter state code for sportsbook deeplinks, e.g. NY, NJ",
+    )
+    async def add_oddible_destination(
+        self,
+        interaction: discord.Interaction,
+        channel: discord.TextChannel | None = None,
+        state: str = DEFAULT_STATE,
+    ):
+        target = channel or interaction.channel
+        if target is None:
+            await interaction.response.send_message("❌ No channel to add.", ephemeral=True)
+            return
+        code = normalize_state(state)
+        if code is None:
+            await interaction.response.send_message(
+                "❌ State must be a two-letter US state code like **NY** or **NJ**.",
+                ephemeral=True,
+            )
+            return
+
+        self.destinations.add(target.id, code)
+        self._save_in_background(self.destinations)
+        await interaction.response.send_message(
+            f"✅ <#{target.id}> will get the Oddible auto-post with **{code.upper()}** links.\n"
+            f"Destinations: {self._destinations_text()}",
+            ephemeral=True,
+        )
+
+    @app_commands.command(
+        name="removeoddibledestination",
+        description="Stop auto-posting Oddible picks to a channel. (Admins only)",
+    )
+    @app_commands.checks.has_permissions(administrator=True)
+    @app_commands.describe(channel="Channel to remove (defaults to this one)")
+    async def remove_oddible_destination(
+        self,
+        interaction: discord.Interaction,
+        channel: discord.TextChannel | None = None,
+    ):
+        target = channel or interaction.channel
+        if target is None or not self.destinations.remove(target.id):
+            await interaction.response.send_message(
+                "❌ That channel isn't an auto-post destination.",
+                ephemeral=True,
+            )
+            return
+
+        self._save_in_background(self.destinations)
+        await interaction.response.send_message(
+            f"🗑️ Removed <#{target.id}>. Destinations: {self._destinations_text()}",
+            ephemeral=True,
+        )
+
+    # ---------------- Slash commands: personal boards ----------------
+
+    @app_commands.command(
+        name="setoddiblestate",
+        description="Set your state so Oddible sportsbook links open in the right region.",
+    )
+    @app_commands.describe(state="Two-letter state code, e.g. NJ, PA, AZ")
+    async def set_oddible_state(self, interaction: discord.Interaction, state: str):
+        code = normalize_state(state)
+        if code is None:
+            await interaction.response.send_message(
+                "❌ State must be a two-letter US state code like **NJ** or **PA**.",
+                ephemeral=True,
+            )
+            return
+
+        self.user_states.set(interaction.user.id, code)
+        self._save_in_background(self.user_states)
+        await interaction.response.send_message(
+            f"📍 Your sportsbook links will use **{code.upper()}**. "
+            f"Try `/oddiblepicks` for your personal board.",
+            ephemeral=True,
+        )
+
+    @app_commands.command(
+        name="oddiblepicks",
+        description="Get an Oddible board with sportsbook links for your state (only you see it).",
+    )
+    @app_commands.describe(
+        board="Which board to show",
+        state="Override your saved state for this board (e.g. NJ)",
+    )
+    async def oddible_picks(
+        self,
+        interaction: discord.Interaction,
+        board: OddibleBoard,
+        state: str | None = None,
+    ):
+        code = normalize_state(state) if state else self.user_states.get(interaction.user.id)
+        if code is None:
+            await interaction.response.send_message(
+                "❌ State must be a two-letter US state code like **NJ** or **PA**.",
+                ephemeral=True,
+            )
+            return
+
+        await interaction.response.defer(ephemeral=True, thinking=True)
+
+        label = board.value
+        leagues, player_props = BOARD_QUERIES[board]
+        # Shared response cache; only the deeplinks differ per state, and
+        # those come from the (book, template, state) cache
+        result = await self._fetch_trending(leagues, player_props, priority=QuotaTracker.LOW)
+        status, _, data = result
+        if status != 200:
+            msg = data.get("message") or data.get("raw") or f"HTTP {status}"
+            await interaction.followup.send(f"⚠️ Oddible error: {msg}", ephemeral=True)
+            return
+
+        messages, _ = self._plan_board(label, result, code)
+        for content, embeds, _ in messages:
+            await interaction.followup.send(content=content, embeds=embeds, ephemeral=True)
+
+    # ---------------- Slash command: pick history ----------------
+
+    @app_commands.command(
+        name="pickhistory",
+        description="Look up picks the bot has posted, e.g. NBA props on one player.",
+    )
+    @app_commands.describe(
+        league="League",
+        days="How many days back to look (default 30)",
+        group="Only this market group",
+        player="Player name (full or part), for player props",
+        team="Team name, nickname or abbreviation",
+    )
+    @app_commands.choices(
+        league=[app_commands.Choice(name=l, value=l) for l in ("NBA", "NFL")],
+        group=[app_commands.Choice(name=GROUP_LABELS.get(g, g.title()), value=g) for g in GROUP_ORDER],
+    )
+    async def pick_history(
+        self,
+        interaction: discord.Interaction,
+        league: app_commands.Choice[str] | None = None,
+        days: app_commands.Range[int, 1, 365] = 30,
+        group: app_commands.Choice[str] | None = None,
+        player: str | None = None,
+        team: str | None = None,
+    ):
+        league_value = league.value if league else None
+        group_value = group.value if group else None
+        try:
+            rows, total = await asyncio.to_thread(
+                self.ledger.history,
+                league=league_value, days=days, group=group_value,
+                player=player, team=team, limit=15,
+            )
+            summary = None
+            if not player and not team:
+                # Whole-slice stats come from the daily rollups, not the picks table
+                summary = await asyncio.to_thread(
+                    self.ledger.summary, league=league_value, days=days, group=group_value,
+                )
+        except sqlite3.Error as e:
+            await interaction.response.send_message(f"⚠️ Pick history unavailable: {e}", ephemeral=True)
+            return
+
+        scope = " · ".join(filter(None, [
+            league_value or "All leagues",
+            GROUP_LABELS.get(group_value, group_value) if group_value else None,
+            player, team,
+            f"last {days} day{'s' if days != 1 else ''}",
+        ]))
+        lines = [f"📜 **Pick history** — {scope}"]
+        if summary is not None:
+            stats = f"{summary['picks']} picks over {summary['days']} days"
+            if summary["avg_hit_rate"] is not None:
+                stats += f" • avg hit rate {summary['avg_hit_rate']:.0f}%"
+            if summary["avg_odds"] is not None:
+                stats += f" • avg odds {summary['avg_odds']:+.0f}"
+            lines.append(stats)
+        else:
+            lines.append(f"{total} matching picks")
+
+        if not rows:
+            lines.append("No posted picks match that.")
+        shown = 0
+        for r in rows:
+            line = f"`{r['post_date']}` {format_pick_line(row_as_pick(r)).splitlines()[0]}"
+            if r["odds"] is not None:
+                line += f" • {r['odds']:+.0f}"
+            if r["hit_rate"] is not None:
+                line += f" • {r['hit_rate']:.0f}%"
+            if sum(len(x) + 1 for x in lines) + len(line) > 1900:
+                break
+            lines.append(line)
+            shown += 1
+        if total > shown:
+            lines.append(f"…and {total - shown} more.")
+
+        await interaction.response.send_message("\n".join(lines), ephemeral=True)
+
+    # ---------------- Slash command: live boards ----------------
+
+    @app_commands.command(
+        name="setoddibleliveboards",
+        description="Edit Oddible boards in place instead of reposting them. (Admins only)",
+    )
+    @app_commands.checks.has_permissions(administrator=True)
+    @app_commands.describe(
+        enabled="Turn live boards On or Off",
+        refresh="Keep live boards updated in the background between posts",
+    )
+    async def set_oddible_live_boards(
+        self,
+        interaction: discord.Interaction,
+        enabled: AutoPostState,
+        refresh: AutoPostState | None = None,
+    ):
+        self.live_boards_enabled = enabled == AutoPostState.ON
+        if refresh is not None:
+            self.live_refresh_enabled = refresh == AutoPostState.ON
+        if self.live_boards_enabled:
+            msg = (
+                "📌 Live boards are now **ON**.\n"
+                "Each channel keeps one board per league; new picks edit it in place."
+            )
+            if self.live_refresh_enabled:
+                msg += "\n🔄 Boards refresh in the background (faster near game time)."
+        else:
+            msg = "📨 Live boards are now **OFF**. Every post sends a new board."
+        await interaction.response.send_message(msg, ephemeral=True)
+
+    # ---------------- Slash command: cache / client stats ----------------
+
+    @app_commands.command(
+        name="oddiblestats",
+        description="Show Oddible cache and client stats. (Admins only)",
+    )
+    @app_commands.checks.has_permissions(administrator=True)
+    async def oddible_stats(self, interaction: discord.Interaction):
+        await interaction.response.send_message(
+            "\n".join(self._stats_lines()),
+            ephemeral=True,
+        )
+
+    def _stats_lines(self) -> List[str]:
+        c = self.cache.stats()
+        f = self.inflight.stats()
+        b = self.breaker.stats()
+        q = self.quota.stats()
+        lp = self.poller.stats()
+        e = EMBED_CACHE.stats()
+        dl = deeplink_markdown.cache_info()
+        renders = RENDER_STATS["renders"]
+        avg_render_ms = (RENDER_STATS["render_seconds"] / renders * 1000) if renders else 0.0
+        m = self.post_stats
+        posts = m["posts"]
+        saved_per_post = (m["saved"] / posts) if posts else 0.0
+        return [
+            "📊 **Oddible stats**",
+            f"Response cache: {c['entries']}/{c['max_entries']} entries • "
+            f"TTL {int(c['ttl'])}s",
+            f"Hits: {c['hits']} • Misses: {c['misses']} • "
+            f"Hit rate: {c['hit_rate']:.0%} • Evictions: {c['evictions']}",
+            f"Upstream calls: {f['calls']} • Coalesced: {f['shared']} • "
+            f"In flight: {f['inflight']}",
+            f"Stale served: {self.stale_served} • Circuit: {b['state']} "
+            f"(trips {b['trips']}, fast-failed {b['rejected']})",
+            f"Quota ({q['key']}): "
+            + (f"{q['remaining']}" + (f"/{q['limit']}" if q["limit"] else "") + f" left ({q['source']})"
+               if q["remaining"] is not None else "no limit known")
+            + f" • Requests this window: {q['sent']} • Deferred: {q['deferred']}"
+            + (f" • Resets in {int(q['reset_in'] // 60)} min" if q["reset_in"] else ""),
+            f"Embed cache: {e['entries']}/{e['max_entries']} • "
+            f"Hit rate: {e['hit_rate']:.0%} ({e['hits']}/{e['hits'] + e['misses']}) • "
+            f"Avg render: {avg_render_ms:.2f} ms",
+            f"Posts: {posts} • Messages sent: {m['messages']} • "
+            f"API calls saved: {m['saved']} ({saved_per_post:.1f}/post)",
+            f"Member states: {len(self.user_states)} • Deeplink cache: "
+            f"{dl.currsize} links, {dl.hits / max(1, dl.hits + dl.misses):.0%} hits",
+            f"Auto-post destinations: {len(self.destinations)} "
+            f"({len(self.destinations.states())} deeplink regions)",
+            f"Live boards: {'on' if self.live_boards_enabled else 'off'} "
+            f"({len(self.live_boards)} tracked) • Edited: {m['edited']} • "
+            f"Unchanged: {m['unchanged']}",
+            f"Live refresh: {'on' if self.live_refresh_enabled else 'off'} • "
+            f"Leagues polled: {lp['tracked']} • Polls: {lp['polls']} • "
+            f"Changed: {lp['changes']}",
+        ]
+
     # ---------------- Prefix commands (unchanged behaviour) ----------------
 
     @commands.command(name="nba")
@@ -0,0 +1 @@
+"""Offline stand-ins for the Oddible API (synthetic picks + a local /trending server)."""
@@ -0,0 +1,246 @@
+"""
+Seeded synthetic /trending picks, shaped like what Oddible actually returns.
+
+Same seed + arguments -> byte-identical output, so benchmark corpora and
+soak tests are reproducible. Scales from a handful of picks to tens of
+thousands; at larger sizes the same bet idea repeats across books just like
+real boards do, so dedupe / diversify still have work to do.
+
+    from oddible.offline.generator import generate_response
+    raw = generate_response(2000, leagues=["NBA", "NFL"], seed=7)
+"""
+from __future__ import annotations
+
+import datetime
+import json
+import random
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..utils import NBA_TEAMS, NFL_TEAMS
+
+PLAYERS = {
+    "NBA": [
+        "Shai Gilgeous-Alexander", "Nikola Jokic", "Luka Doncic", "Jayson Tatum",
+        "Giannis Antetokounmpo", "Victor Wembanyama", "Anthony Edwards",
+        "Jalen Brunson", "Donovan Mitchell", "Tyrese Haliburton", "Stephen Curry",
+        "LeBron James", "Kevin Durant", "Devin Booker", "De'Aaron Fox",
+        "Cade Cunningham", "Paolo Banchero", "Trae Young", "Jaren Jackson Jr.",
+        "Alperen Sengun", "Bam Adebayo", "Scottie Barnes", "Lauri Markkanen",
+    ],
+    "NFL": [
+        "Patrick Mahomes", "Josh Allen", "Lamar Jackson", "Jalen Hurts",
+        "Joe Burrow", "Christian McCaffrey", "Saquon Barkley", "Derrick Henry",
+        "Bijan Robinson", "Justin Jefferson", "Ja'Marr Chase", "CeeDee Lamb",
+        "Tyreek Hill", "Amon-Ra St. Brown", "Travis Kelce", "George Kittle",
+        "A.J. Brown", "Puka Nacua", "Breece Hall", "Jahmyr Gibbs",
+    ],
+}
+
+TEAMS = {"NBA": NBA_TEAMS, "NFL": NFL_TEAMS}
+
+# (market, (lowest line, highest line)) per league
+PROP_MARKETS = {
+    "NBA": [
+        ("Player Points", (9.5, 34.5)),
+        ("Alternate Player Points", (9.5, 39.5)),
+        ("Player Rebounds", (2.5, 13.5)),
+        ("Player Assists", (1.5, 11.5)),
+        ("Player Threes", (0.5, 5.5)),
+        ("Player Made Threes", (0.5, 5.5)),
+        ("Player Steals", (0.5, 2.5)),
+        ("Player Blocks", (0.5, 3.5)),
+        ("Player Points + Rebounds + Assists", (14.5, 49.5)),
+    ],
+    "NFL": [
+        ("Player Passing Yards", (174.5, 299.5)),
+        ("Player Rushing Yards", (29.5, 109.5)),
+        ("Player Receiving Yards", (19.5, 99.5)),
+        ("Player Receptions", (1.5, 8.5)),
+        ("Player Passing Touchdowns", (0.5, 2.5)),
+        ("Player Anytime Touchdowns", (0.5, 0.5)),
+        ("Player Pass Completions", (16.5, 27.5)),
+    ],
+}
+
+GAME_MARKETS = {
+    "NBA": {
+        "spread": [("Spread", (1.5, 13.5)), ("Alternate Spread", (1.5, 19.5)),
+                   ("1st Half Spread", (0.5, 7.5))],
+        "totals": [("Game Total", (205.5, 245.5)), ("Alternate Game Total", (195.5, 255.5)),
+                   ("Team Total", (99.5, 125.5)), ("Alternate Team Total", (95.5, 130.5))],
+        "moneyline": ["Moneyline", "1st Quarter Moneyline"],
+        "other": ["Double Result"],
+    },
+    "NFL": {
+        "spread": [("Spread", (1.5, 10.5)), ("Alternate Spread", (1.5, 17.5)),
+                   ("1st Half Spread", (0.5, 6.5))],
+        "totals": [("Game Total", (37.5, 54.5)), ("Alternate Game Total", (30.5, 60.5)),
+                   ("Team Total", (16.5, 30.5))],
+        "moneyline": ["Moneyline", "1st Half Moneyline"],
+        "other": ["Double Result", "Winning Margin"],
+    },
+}
+
+# Deeplink templates the way Oddible sends them: mixed-case book keys and
+# {state} / {wagerAmount} placeholders the bot fills in.
+DEEPLINK_TEMPLATES = {
+    "draftkings": ("Draftkings", "https://sportsbook.draftkings.com/event/{state}/{slug}?wager={wagerAmount}"),
+    "fanduel": ("Fanduel", "https://{state}.sportsbook.fanduel.com/addToBetslip?marketId={id}"),
+    "betmgm": ("betmgm", "https://sports.{state}.betmgm.com/en/sports?options={id}"),
+    "betrivers": ("BetRivers", "https://{state}.betrivers.com/?page=sportsbook#event/{id}"),
+    "espnbet": ("ESPNBet", "https://espnbet.com/sport/{id}?state={state}"),
+    "fanatics": ("Fanatics", "https://sportsbook.fanatics.com/{state}/event/{id}"),
+    "hardrockbet": ("HardRockBet", "https://app.hardrock.bet/{state}/event/{id}"),
+    "novig": ("Novig", "https://app.novig.us/event/{id}"),
+    "prophetx": ("ProphetX", "https://www.prophetx.co/event/{id}"),
+    "prizepicks": ("PrizePicks", "https://app.prizepicks.com/board?projId={id}"),
+    "underdog": ("Underdog", "https://underdogfantasy.com/pick-em/higher-lower?state={state}"),
+}
+
+# Books in the per-book odds blob. The bot never reads it, but real picks
+# carry it, so the streaming parser has something to throw away.
+_BOOK_ODDS_SAMPLE = ("draftkings", "fanduel", "betmgm", "caesars")
+
+
+def _line(rng: random.Random, lo: float, hi: float) -> float:
+    steps = int(hi - lo)
+    return lo + rng.randint(0, steps) if steps > 0 else lo
+
+
+def _odds(rng: random.Random) -> Optional[int]:
+    if rng.random() < 0.04:
+        return None
+    if rng.random() < 0.7:
+        return -rng.randrange(100, 260, 5)
+    return rng.randrange(100, 320, 5)
+
+
+def _hit_rate(rng: random.Random) -> Tuple[Optional[int], Optional[int], Optional[float]]:
+    roll = rng.random()
+    if roll < 0.03:
+        return None, None, None
+    if roll < 0.06:
+        return 0, 0, 0.0
+    total = rng.choice((3, 5, 5, 8, 10, 10, 12, 15, 20))
+    wins = rng.randint(total // 3, total)
+    return wins, total, round(100.0 * wins / total, 1)
+
+
+def _deeplinks(rng: random.Random, sportsbooks: Sequence[str], slug: str, pid: int) -> str:
+    wanted = [b for b in sportsbooks if b in DEEPLINK_TEMPLATES]
+    extras = [b for b in DEEPLINK_TEMPLATES if b not in wanted]
+    books = wanted + rng.sample(extras, k=rng.randint(0, 2))
+    if rng.random() < 0.05:
+        books = []
+    links = {}
+    for book in books:
+        label, template = DEEPLINK_TEMPLATES[book]
+        links[label] = template.replace("{slug}", slug).replace("{id}", str(100000 + pid))
+    return json.dumps(links)
+
+
+def _schedule(rng: random.Random, league: str, start: datetime.datetime) -> List[Tuple[str, str, str]]:
+    """A slate of (away_abbr, home_abbr, commence_time) with no team playing twice."""
+    abbrs = sorted(TEAMS[league])
+    rng.shuffle(abbrs)
+    games = []
+    for i in range(0, len(abbrs) - 1, 2):
+        tip = start + datetime.timedelta(minutes=30 * rng.randint(0, 10))
+        games.append((abbrs[i], abbrs[i + 1], tip.strftime("%Y-%m-%dT%H:%M:%SZ")))
+    return games
+
+
+def generate_picks(
+    n: int,
+    leagues: Sequence[str] = ("NBA",),
+    seed: int = 0,
+    player_props: bool | None = None,
+    sportsbooks: Sequence[str] | None = None,
+    start: datetime.datetime | None = None,
+) -> List[Dict[str, Any]]:
+    """
+    n synthetic picks spread round-robin over `leagues` (NBA / NFL).
+    player_props=True -> props only, False -> no props, None -> a mix.
+    """
+    rng = random.Random(seed)
+    sportsbooks = [b.lower() for b in (sportsbooks or ["draftkings"])]
+    start = start or datetime.datetime(2025, 11, 13, 23, 0, tzinfo=datetime.timezone.utc)
+    leagues = [l.upper() for l in leagues if l.upper() in TEAMS] or ["NBA"]
+    slates = {league: _schedule(rng, league, start) for league in leagues}
+
+    picks: List[Dict[str, Any]] = []
+    for i in range(n):
+        league = leagues[i % len(leagues)]
+        teams = TEAMS[league]
+        away, home, commence = rng.choice(slates[league])
+        slug = f"{away.lower()}-{home.lower()}"
+
+        if player_props is True or (player_props is None and rng.random() < 0.45):
+            market, (lo, hi) = rng.choice(PROP_MARKETS[league])
+            outcome_name = rng.choice(("Over", "Under"))
+            description = rng.choice(PLAYERS[league])
+            point: Optional[float] = _line(rng, lo, hi)
+        else:
+            kind = rng.choice(("spread", "spread", "totals", "totals", "moneyline", "other"))
+            description = ""
+            if kind == "spread":
+                market, (lo, hi) = rng.choice(GAME_MARKETS[league]["spread"])
+                outcome_name = teams[rng.choice((away, home))]
+                point = _line(rng, lo, hi) * rng.choice((1, -1))
+            elif kind == "totals":
+                market, (lo, hi) = rng.choice(GAME_MARKETS[league]["totals"])
+                outcome_name = rng.choice(("Over", "Under"))
+                point = _line(rng, lo, hi)
+                if market.startswith(("Team", "Alternate Team")):
+                    description = teams[rng.choice((away, home))]
+            elif kind == "moneyline":
+                market = rng.choice(GAME_MARKETS[league]["moneyline"])
+                outcome_name = teams[rng.choice((away, home))]
+                point = None
+            else:
+                market = rng.choice(GAME_MARKETS[league]["other"])
+                outcome_name = rng.choice((teams[away], teams[home], "Draw"))
+                point = None
+
+        wins, total, pct = _hit_rate(rng)
+        picks.append({
+            "league": league,
+            "away_team": teams[away],
+            "home_team": teams[home],
+            "away_team_abbreviation": away,
+            "home_team_abbreviation": home,
+            "commence_time": commence,
+            "market": market,
+            "outcome_name": outcome_name,
+            "outcome_description": description,
+            "outcome_point": point,
+            "bestOdds": _odds(rng),
+            "bestBook": rng.choice(sportsbooks),
+            "hit_rate_wins": wins,
+            "hit_rate_total": total,
+            "hit_rate_percentage": pct,
+            "deepLinks": _deeplinks(rng, sportsbooks, slug, i),
+            "pick_id": f"pk_{seed}_{i:06d}",
+            "model_confidence": round(rng.random(), 3),
+            "sportsbook_odds": json.dumps({b: -rng.randrange(100, 130) for b in _BOOK_ODDS_SAMPLE}),
+        })
+    return picks
+
+
+def generate_response(
+    n: int,
+    leagues: Sequence[str] = ("NBA",),
+    seed: int = 0,
+    player_props: bool | None = None,
+    sportsbooks: Sequence[str] | None = None,
+) -> Dict[str, Any]:
+    """A full /trending body: {"status": "success", "data": {"count", "leagues", "picks"}}."""
+    picks = generate_picks(n, leagues, seed=seed, player_props=player_props, sportsbooks=sportsbooks)
+    return {
+        "status": "success",
+        "data": {
+            "count": len(picks),
+            "leagues": [l.upper() for l in leagues],
+            "picks": picks,
+        },
+    }
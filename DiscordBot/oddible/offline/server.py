@@ -0,0 +1,174 @@
+"""
+Local stand-in for Oddible's /trending endpoint.
+
+Implements the contract the cog relies on (POST JSON payload with leagues /
+num_picks / sportsbooks / risk / player_props, at most num_picks picks back
+unless ?picks= overrides it, X-API-Key header, a
+{"status", "data": {"count", "leagues", "picks"}} body with deepLinks as
+JSON strings) using the seeded generator, plus the failure modes the cog
+has to survive.
+
+Run from the DiscordBot folder:
+    python -m oddible.offline.server [--port 8787] [--picks 200] [--seed 0] [--mode ok]
+
+then point the bot at it:
+    ODDIBLE_URL=http://127.0.0.1:8787/api/oddible/trending ODDIBLE_API_KEY=dev
+
+Modes (--mode, or per request via the X-Standin-Mode header):
+    ok         normal response
+    slow       normal response after --delay seconds
+    timeout    hangs for --hang seconds (longer than the client's timeout)
+    error      HTTP 500 with an error body
+    ratelimit  HTTP 429 with Retry-After
+    malformed  HTTP 200 with a truncated body
+    flaky      --fail-rate of requests fail (500), the rest are ok
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+from typing import Any, Dict, Optional
+
+from aiohttp import web
+
+from .generator import generate_response
+
+TRENDING_PATH = "/api/oddible/trending"
+MODES = ("ok", "slow", "timeout", "error", "ratelimit", "malformed", "flaky")
+
+# Bodies are written in pieces this big so clients actually see a stream
+WRITE_CHUNK_SIZE = 64 * 1024
+
+
+class StandinConfig:
+    def __init__(
+        self,
+        picks: int = 200,
+        seed: int = 0,
+        mode: str = "ok",
+        delay: float = 2.0,
+        hang: float = 60.0,
+        fail_rate: float = 0.3,
+        api_key: Optional[str] = None,
+    ):
+        self.picks = picks
+        self.seed = seed
+        self.mode = mode
+        self.delay = delay
+        self.hang = hang
+        self.fail_rate = fail_rate
+        self.api_key = api_key
+        self.requests = 0
+
+
+def _error(status: int, message: str, headers: Optional[Dict[str, str]] = None) -> web.Response:
+    return web.json_response({"status": "error", "message": message}, status=status, headers=headers)
+
+
+async def _write_body(request: web.Request, body: bytes) -> web.StreamResponse:
+    resp = web.StreamResponse(status=200, headers={"Content-Type": "application/json"})
+    await resp.prepare(request)
+    for i in range(0, len(body), WRITE_CHUNK_SIZE):
+        await resp.write(body[i:i + WRITE_CHUNK_SIZE])
+    await resp.write_eof()
+    return resp
+
+
+def make_app(config: StandinConfig) -> web.Application:
+    rng = random.Random(config.seed)
+
+    async def trending(request: web.Request) -> web.StreamResponse:
+        config.requests += 1
+
+        if config.api_key is not None and request.headers.get("X-API-Key") != config.api_key:
+            return _error(401, "Invalid API key")
+        try:
+            payload: Dict[str, Any] = await request.json()
+        except ValueError:
+            return _error(400, "Body must be JSON")
+        leagues = payload.get("leagues")
+        if not isinstance(leagues, list) or not leagues:
+            return _error(422, "leagues must be a non-empty list")
+
+        mode = request.headers.get("X-Standin-Mode", config.mode)
+        if mode == "flaky":
+            mode = "error" if rng.random() < config.fail_rate else "ok"
+        if mode == "timeout":
+            await asyncio.sleep(config.hang)
+        elif mode == "slow":
+            await asyncio.sleep(config.delay)
+        elif mode == "error":
+            return _error(500, "Internal server error (stand-in)")
+        elif mode == "ratelimit":
+            return _error(429, "Rate limit exceeded (stand-in)", headers={"Retry-After": "30"})
+
+        # Like the real API, return at most num_picks; ?picks= overrides it
+        # for one request, --picks is the size when the payload doesn't say
+        num_picks = payload.get("num_picks")
+        if not isinstance(num_picks, int) or isinstance(num_picks, bool) or num_picks < 0:
+            num_picks = config.picks
+        try:
+            n = int(request.query.get("picks", num_picks))
+        except ValueError:
+            n = num_picks
+        data = generate_response(
+            n,
+            leagues=leagues,
+            seed=config.seed,
+            player_props=payload.get("player_props"),
+            sportsbooks=payload.get("sportsbooks"),
+        )
+        body = json.dumps(data).encode("utf-8")
+        if mode == "malformed":
+            body = body[: max(1, len(body) // 2)]
+        return await _write_body(request, body)
+
+    app = web.Application()
+    app.router.add_post(TRENDING_PATH, trending)
+    app.router.add_post("/trending", trending)
+    return app
+
+
+async def start_standin(
+    config: StandinConfig,
+    host: str = "127.0.0.1",
+    port: int = 8787,
+) -> web.AppRunner:
+    """Start the stand-in inside the current event loop (for soak tests / benchmarks)."""
+    runner = web.AppRunner(make_app(config))
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    return runner
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline Oddible /trending stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--picks", type=int, default=200, help="picks per response when the payload has no num_picks")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--mode", choices=MODES, default="ok")
+    parser.add_argument("--delay", type=float, default=2.0, help="seconds, for --mode slow")
+    parser.add_argument("--hang", type=float, default=60.0, help="seconds, for --mode timeout")
+    parser.add_argument("--fail-rate", type=float, default=0.3, help="for --mode flaky")
+    parser.add_argument("--api-key", default=None, help="require this X-API-Key")
+    args = parser.parse_args()
+
+    config = StandinConfig(
+        picks=args.picks,
+        seed=args.seed,
+        mode=args.mode,
+        delay=args.delay,
+        hang=args.hang,
+        fail_rate=args.fail_rate,
+        api_key=args.api_key,
+    )
+    print(f"Oddible stand-in on http://{args.host}:{args.port}{TRENDING_PATH} "
+          f"({args.picks} picks, seed {args.seed}, mode {args.mode})")
+    web.run_app(make_app(config), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from typing import Iterable, Iterator, List, Sequence
+
+import discord
+
+# Discord's per-message limits
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000  # title + description + fields + footer + author, summed
+
+
+def pack_embed_blocks(
+    blocks: Sequence[Sequence[discord.Embed]],
+    max_embeds: int = MAX_EMBEDS_PER_MESSAGE,
+    max_chars: int = MAX_EMBED_CHARS_PER_MESSAGE,
+) -> List[List[discord.Embed]]:
+    """
+    Pack embeds into as few messages as Discord's limits allow, in order.
+
+    `blocks` are runs of embeds that belong together (a group header and
+    its pick cards). A block is never split across messages unless it can't
+    fit in a message on its own, so a header always sits with its picks.
+    Order is never changed; each message is filled as far as it will go.
+    """
+    return list(iter_packed_embeds(blocks, max_embeds=max_embeds, max_chars=max_chars))
+
+
+def iter_packed_embeds(
+    blocks: Iterable[Sequence[discord.Embed]],
+    max_embeds: int = MAX_EMBEDS_PER_MESSAGE,
+    max_chars: int = MAX_EMBED_CHARS_PER_MESSAGE,
+) -> Iterator[List[discord.Embed]]:
+    """
+    pack_embed_blocks() as a generator: `blocks` is consumed lazily and
+    each message is yielded as soon as the next block doesn't fit in it.
+    """
+    current: List[discord.Embed] = []
+    current_chars = 0
+
+    for block in blocks:
+        block = list(block)
+        if not block:
+            continue
+        block_chars = sum(len(e) for e in block)
+
+        if len(current) + len(block) <= max_embeds and current_chars + block_chars <= max_chars:
+            current.extend(block)
+            current_chars += block_chars
+            continue
+
+        if len(block) <= max_embeds and block_chars <= max_chars:
+            if current:
+                yield current
+            current, current_chars = block, block_chars
+            continue
+
+        # Oversized block: it gets split anyway, so top up the current message first
+        for embed in block:
+            size = len(embed)
+            if current and (len(current) >= max_embeds or current_chars + size > max_chars):
+                yield current
+                current, current_chars = [], 0
+            current.append(embed)
+            current_chars += size
+
+    if current:
+        yield current
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import datetime
+import hashlib
+import time
+from typing import Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from .utils import GROUP_ORDER, pick_fingerprint, select_board
+
+
+def board_content_hash(raw_json: dict, max_per_group: int = 3) -> str:
+    """Hash of what a board would show (the selected picks), not of the whole response."""
+    board = select_board(raw_json, max_per_group=max_per_group)
+    shown = tuple(
+        (gkey, tuple(pick_fingerprint(p) for p in board.get(gkey, [])))
+        for gkey in GROUP_ORDER
+    )
+    return hashlib.sha1(repr(shown).encode("utf-8")).hexdigest()[:20]
+
+
+def parse_commence_time(value) -> Optional[float]:
+    """Epoch seconds from an Oddible commence_time (ISO 8601, 'Z' allowed)."""
+    if not value:
+        return None
+    try:
+        dt = datetime.datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=datetime.timezone.utc)
+    return dt.timestamp()
+
+
+def next_commence(raw_json: dict, now: float) -> Optional[float]:
+    """Start time of the next game on the board's picks (None if none left)."""
+    board = select_board(raw_json, max_per_group=3)
+    upcoming = []
+    for gkey in GROUP_ORDER:
+        for p in board.get(gkey, []):
+            t = parse_commence_time(p.get("commence_time"))
+            if t is not None and t > now:
+                upcoming.append(t)
+    return min(upcoming) if upcoming else None
+
+
+class AdaptivePoller:
+    """
+    When to poll Oddible next, per board key.
+
+    - within `near_window` seconds of the next game start → `fast`
+    - overnight (`quiet_hours` local time, no game within the window) → `slow`
+    - otherwise → `normal`
+    Every response whose content hash matches the previous one doubles the
+    interval (capped at `max_interval`); a change snaps it back.
+    """
+
+    def __init__(
+        self,
+        fast: float = 120.0,
+        normal: float = 600.0,
+        slow: float = 3600.0,
+        max_interval: float = 3600.0,
+        near_window: float = 5400.0,
+        quiet_hours: Tuple[int, int] = (1, 9),
+        tz: datetime.tzinfo = datetime.timezone.utc,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.fast = fast
+        self.normal = normal
+        self.slow = slow
+        self.max_interval = max_interval
+        self.near_window = near_window
+        self.quiet_hours = quiet_hours
+        self.tz = tz
+        self.clock = clock
+        # key -> (digest, unchanged_streak, next_due, interval)
+        self._state: Dict[Hashable, Tuple[Optional[str], int, float, float]] = {}
+        self.polls = 0
+        self.changes = 0
+
+    def _quiet(self, now: float) -> bool:
+        start, end = self.quiet_hours
+        hour = datetime.datetime.fromtimestamp(now, self.tz).hour
+        return start <= hour < end if start <= end else (hour >= start or hour < end)
+
+    def base_interval(self, now: float, next_game: Optional[float]) -> float:
+        if next_game is not None and next_game - now <= self.near_window:
+            return self.fast
+        if self._quiet(now):
+            return self.slow
+        return self.normal
+
+    def due(self, key: Hashable) -> bool:
+        state = self._state.get(key)
+        return state is None or self.clock() >= state[2]
+
+    def observe(self, key: Hashable, digest: str, next_game: Optional[float] = None) -> bool:
+        """
+        Record a poll result and schedule the next poll.
+        Returns True if the content changed (or this is the first poll).
+        """
+        now = self.clock()
+        previous, streak, _, _ = self._state.get(key, (None, 0, 0.0, 0.0))
+        changed = digest != previous
+        streak = 0 if changed else streak + 1
+        interval = min(self.base_interval(now, next_game) * (2 ** streak), self.max_interval)
+        self._state[key] = (digest, streak, now + interval, interval)
+        self.polls += 1
+        self.changes += int(changed)
+        return changed
+
+    def defer(self, key: Hashable, seconds: Optional[float] = None):
+        """Try again later without a result (fetch failed / no quota)."""
+        digest, streak, _, interval = self._state.get(key, (None, 0, 0.0, self.normal))
+        wait = seconds if seconds is not None else max(interval, self.normal)
+        self._state[key] = (digest, streak, self.clock() + wait, interval)
+
+    def retain(self, keys: Iterable[Hashable]):
+        """Drop schedule state for everything not in `keys` (boards no longer tracked)."""
+        keep = set(keys)
+        for key in [k for k in self._state if k not in keep]:
+            del self._state[key]
+
+    def next_due(self, key: Hashable) -> Optional[float]:
+        state = self._state.get(key)
+        return state[2] if state else None
+
+    def stats(self) -> Dict[str, float]:
+        return {"tracked": len(self._state), "polls": self.polls, "changes": self.changes}
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Mapping, Optional
+
+# Header spellings seen in the wild, checked case-insensitively in order
+_LIMIT_HEADERS = ("x-ratelimit-limit", "ratelimit-limit", "x-rate-limit-limit")
+_REMAINING_HEADERS = ("x-ratelimit-remaining", "ratelimit-remaining", "x-rate-limit-remaining")
+_RESET_HEADERS = ("x-ratelimit-reset", "ratelimit-reset", "x-rate-limit-reset")
+
+# Reset values above this are epoch timestamps, below it seconds-from-now
+_EPOCH_CUTOFF = 1e9
+
+
+def _header(headers: Mapping[str, str], names: tuple) -> Optional[float]:
+    lowered = {k.lower(): v for k, v in headers.items()}
+    for name in names:
+        value = lowered.get(name)
+        if value is None:
+            continue
+        try:
+            # IETF drafts allow "100;w=60" style values; the number comes first
+            return float(str(value).split(",")[0].split(";")[0].strip())
+        except ValueError:
+            continue
+    return None
+
+
+def key_id(api_key: str) -> str:
+    """Short, non-reversible label for an API key (for logs / stats)."""
+    return hashlib.sha1(api_key.encode("utf-8")).hexdigest()[:8]
+
+
+class QuotaTracker:
+    """
+    Rolling request budget for one Oddible API key.
+
+    Every upstream request is recorded with its response headers. When
+    Oddible sends rate-limit headers (X-RateLimit-Limit / -Remaining /
+    -Reset, the IETF RateLimit-* set, or Retry-After on a 429) they are
+    the source of truth until their reset time; requests made since then
+    are subtracted locally. Without headers, requests are counted against
+    `budget` per rolling `window` seconds (budget 0 = no local limit).
+
+    allow() keeps the last `reserve` requests for high-priority callers
+    (the scheduled auto-post): low-priority ones are refused once the
+    remaining budget drops to the reserve.
+    """
+
+    HIGH = "high"
+    LOW = "low"
+
+    def __init__(
+        self,
+        api_key: str = "",
+        budget: int = 0,
+        window: float = 86400.0,
+        reserve: int = 10,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.key_id = key_id(api_key)
+        self.budget = budget
+        self.window = window
+        self.reserve = reserve
+        self.clock = clock
+        self._sent: Deque[float] = deque()
+        self._total = 0
+        # Last upstream-reported state: (remaining, limit, reset_at, requests so far)
+        self._reported: Optional[tuple] = None
+        self.deferred = 0
+
+    def _prune(self, now: float):
+        while self._sent and now - self._sent[0] >= self.window:
+            self._sent.popleft()
+
+    def record(self, status: int, headers: Mapping[str, str] | None = None):
+        """Call once per upstream request (status 0 for network errors)."""
+        now = self.clock()
+        self._sent.append(now)
+        self._total += 1
+        self._prune(now)
+        headers = headers or {}
+
+        if status == 429:
+            retry_after = _header(headers, ("retry-after",))
+            reset_at = now + (retry_after if retry_after is not None else 60.0)
+            limit = self._reported[1] if self._reported else None
+            self._reported = (0, limit, reset_at, self._total)
+            return
+
+        remaining = _header(headers, _REMAINING_HEADERS)
+        if remaining is None:
+            return
+        limit = _header(headers, _LIMIT_HEADERS)
+        reset = _header(headers, _RESET_HEADERS)
+        if reset is None:
+            reset_at = now + self.window
+        elif reset > _EPOCH_CUTOFF:
+            reset_at = reset
+        else:
+            reset_at = now + reset
+        self._reported = (int(remaining), int(limit) if limit is not None else None, reset_at, self._total)
+
+    def remaining(self) -> Optional[int]:
+        """Requests left in the current window, or None if unknown / unlimited."""
+        now = self.clock()
+        self._prune(now)
+        if self._reported is not None:
+            remaining, _, reset_at, seen_total = self._reported
+            if now < reset_at:
+                # The request that carried the headers is already counted in them
+                return max(0, remaining - (self._total - seen_total))
+            self._reported = None
+        if self.budget > 0:
+            return max(0, self.budget - len(self._sent))
+        return None
+
+    def reset_in(self) -> float:
+        """Seconds until the reported window resets / the oldest counted request ages out (0 if unknown)."""
+        now = self.clock()
+        if self._reported is not None and now < self._reported[2]:
+            return self._reported[2] - now
+        if self.budget > 0 and self._sent:
+            return max(0.0, self.window - (now - self._sent[0]))
+        return 0.0
+
+    def allow(self, priority: str = HIGH) -> bool:
+        """May a request of this priority go upstream now?"""
+        if priority == self.HIGH:
+            return True
+        remaining = self.remaining()
+        if remaining is None or remaining > self.reserve:
+            return True
+        self.deferred += 1
+        return False
+
+    def stats(self) -> Dict[str, Any]:
+        remaining = self.remaining()
+        return {
+            "key": self.key_id,
+            "remaining": remaining,
+            "limit": (self._reported[1] if self._reported else None) or (self.budget or None),
+            "source": "headers" if self._reported is not None else ("counted" if self.budget else "none"),
+            "sent": len(self._sent),
+            "reset_in": self.reset_in(),
+            "deferred": self.deferred,
+        }
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, Optional
+
+from .snapshots import JsonFileStore
+
+# Deeplink region used when nobody picked one
+DEFAULT_STATE = "ny"
+
+# Two-letter codes sportsbook deeplinks use for {state}
+US_STATE_CODES = frozenset({
+    "al", "ak", "az", "ar", "ca", "co", "ct", "de", "dc", "fl", "ga", "hi",
+    "id", "il", "in", "ia", "ks", "ky", "la", "me", "md", "ma", "mi", "mn",
+    "ms", "mo", "mt", "ne", "nv", "nh", "nj", "nm", "ny", "nc", "nd", "oh",
+    "ok", "or", "pa", "ri", "sc", "sd", "tn", "tx", "ut", "vt", "va", "wa",
+    "wv", "wi", "wy",
+})
+
+
+def normalize_state(state: str | None) -> Optional[str]:
+    """'NJ' / ' nj ' -> 'nj'; None if it isn't a US state code."""
+    if not state:
+        return None
+    code = state.strip().lower()
+    return code if code in US_STATE_CODES else None
+
+
+class UserStateStore(JsonFileStore):
+    """Each member's deeplink state (user ID -> two-letter code)."""
+
+    def __init__(self, path: Path | str):
+        super().__init__(path)
+        self._states: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def get(self, user_id: int, default: str = DEFAULT_STATE) -> str:
+        return self._states.get(user_id, default)
+
+    def set(self, user_id: int, state: str):
+        self._states[int(user_id)] = state
+
+    def snapshot(self) -> dict:
+        return {str(uid): code for uid, code in self._states.items()}
+
+    def _from_record(self, raw: dict):
+        self._states = {int(uid): str(code) for uid, code in raw.items()}
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Dict
+
+
+class CircuitBreaker:
+    """
+    Classic three-state circuit breaker for the Oddible upstream.
+
+    - closed:    requests flow; consecutive failures are counted.
+    - open:      after `failure_threshold` failures in a row, fail fast
+                 for `cooldown` seconds without touching the network.
+    - half_open: once the cool-down passes, let exactly one probe through.
+                 Success closes the circuit, failure re-opens it.
+
+    Report every upstream response through record_result() (or the
+    success / failure pair) so a probe is always released.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        cooldown: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trips = 0
+        self.rejected = 0
+        self._probe_in_flight = False
+
+    def allow(self) -> bool:
+        """
+        Should a request go upstream right now?
+        In half-open state only the first caller gets True (the probe).
+        """
+        if self.state == self.OPEN:
+            if self.clock() - self.opened_at >= self.cooldown:
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            else:
+                self.rejected += 1
+                return False
+
+        if self.state == self.HALF_OPEN:
+            if self._probe_in_flight:
+                self.rejected += 1
+                return False
+            self._probe_in_flight = True
+
+        return True
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self.failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        self._probe_in_flight = False
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.trips += 1
+            self.state = self.OPEN
+            self.opened_at = self.clock()
+
+    def record_result(self, status: int):
+        """
+        Record an upstream response by status. 200 is a success, an upstream
+        failure (see is_upstream_failure) a failure. Anything else, e.g. a
+        401 / 404 / 422, means upstream answered, so it leaves the failure
+        count alone, but a half-open probe that got it closes the circuit.
+        """
+        if status == 200:
+            self.record_success()
+        elif is_upstream_failure(status):
+            self.record_failure()
+        elif self.state == self.HALF_OPEN:
+            self.record_success()
+
+    def retry_after(self) -> float:
+        """Seconds left in the cool-down (0 unless open)."""
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self.cooldown - (self.clock() - self.opened_at))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "trips": self.trips,
+            "rejected": self.rejected,
+            "retry_after": self.retry_after(),
+        }
+
+
+def is_upstream_failure(status: int) -> bool:
+    """Network errors / timeouts (status 0), throttling and 5xx count against the breaker."""
+    return status == 0 or status == 429 or status >= 500
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+
+def _key_to_json(key: tuple) -> list:
+    return [list(part) if isinstance(part, tuple) else part for part in key]
+
+
+def _key_from_json(raw: list) -> tuple:
+    return tuple(tuple(part) if isinstance(part, list) else part for part in raw)
+
+
+def write_json_atomic(path: Path, obj: Any):
+    """Write compact JSON to a temp file next to `path`, then os.replace() it in."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp_", suffix=".json")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(obj, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class JsonFileStore:
+    """
+    Base for small in-memory stores mirrored to one JSON file (written
+    atomically, like the snapshots) so they survive restarts.
+
+    Subclasses build their JSON record in snapshot() and read it back in
+    _from_record(), replacing their state only once the whole record has
+    parsed. load()/save() block: call them via asyncio.to_thread, passing
+    save() a snapshot() taken on the event loop thread.
+    """
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+
+    def snapshot(self) -> Any:
+        """The JSON record for save(); take it on the event loop thread."""
+        raise NotImplementedError
+
+    def _from_record(self, raw: Any):
+        raise NotImplementedError
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+            self._from_record(raw)
+        except (OSError, ValueError, KeyError, AttributeError, TypeError):
+            return  # no file yet, or unreadable: keep the empty state
+
+    def save(self, record: Any = None):
+        write_json_atomic(self.path, self.snapshot() if record is None else record)
+
+
+class SnapshotStore:
+    """
+    Last successful /trending response per payload key, on disk.
+
+    One compact JSON file per key, written to a temp file and os.replace()'d
+    into place so a crash mid-write never leaves a half-written snapshot.
+    The methods are blocking; call them via asyncio.to_thread from the cog.
+    """
+
+    def __init__(self, directory: Path | str):
+        self.directory = Path(directory)
+
+    def _path_for(self, key: tuple) -> Path:
+        digest = hashlib.sha1(json.dumps(_key_to_json(key)).encode("utf-8")).hexdigest()
+        return self.directory / f"trending_{digest[:16]}.json"
+
+    def save(
+        self,
+        key: tuple,
+        result: Tuple[int, Dict[str, Any], Dict[str, Any]],
+        stored_at: float | None = None,
+    ):
+        status, _headers, data = result
+        record = {
+            "key": _key_to_json(key),
+            "stored_at": time.time() if stored_at is None else stored_at,
+            "status": status,
+            "data": data,
+        }
+        write_json_atomic(self._path_for(key), record)
+
+    def load_all(
+        self,
+        max_age: float | None = None,
+    ) -> List[Tuple[tuple, float, Tuple[int, Dict[str, Any], Dict[str, Any]]]]:
+        """
+        Return [(key, stored_at, (status, headers, data)), ...] for every
+        readable snapshot, skipping ones older than max_age seconds.
+        """
+        if not self.directory.is_dir():
+            return []
+
+        now = time.time()
+        out = []
+        for path in self.directory.glob("trending_*.json"):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    record = json.load(f)
+                key = _key_from_json(record["key"])
+                stored_at = float(record["stored_at"])
+                result = (int(record["status"]), {}, record["data"])
+            except (OSError, ValueError, KeyError, TypeError):
+                continue
+            if max_age is not None and now - stored_at > max_age:
+                continue
+            out.append((key, stored_at, result))
+
+        out.sort(key=lambda item: item[1])  # oldest first, so LRU keeps the newest
+        return out
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import codecs
+import json
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Pick fields the bot actually reads (rendering, grouping, league split,
+# scheduling). Everything else is dropped as soon as a pick is decoded.
+RENDER_FIELDS = frozenset({
+    "home_team", "away_team",
+    "home_team_abbreviation", "away_team_abbreviation",
+    "market", "outcome_name", "outcome_point", "outcome_description",
+    "bestOdds", "hit_rate_wins", "hit_rate_total", "hit_rate_percentage",
+    "deepLinks",
+    "league", "sport", "sport_key", "sport_title", "commence_time",
+})
+
+_WHITESPACE = " \t\r\n"
+
+
+def trim_pick(p: Dict[str, Any], fields: Iterable[str] = RENDER_FIELDS) -> Dict[str, Any]:
+    """Keep only the fields we render."""
+    return {k: v for k, v in p.items() if k in fields}
+
+
+class PicksStreamParser:
+    """
+    Incremental parser for an Oddible /trending body.
+
+    Feed it raw bytes as they arrive; it walks the JSON structure until it
+    reaches data.picks and from then on decodes one pick at a time, handing
+    back each complete (trimmed) pick as soon as its closing brace arrives.
+    Only the text of the pick currently being decoded is buffered. The rest
+    of the envelope (status, data.count, ...) is kept with data.picks
+    emptied and parsed by close().
+    """
+
+    def __init__(self, fields: Optional[Iterable[str]] = RENDER_FIELDS):
+        self.fields = frozenset(fields) if fields is not None else None
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._envelope: List[str] = []  # envelope text with data.picks left empty
+        self._buf = ""                  # undecoded picks text
+        self._in_picks = False
+        self._picks_done = False
+        self._first_pick = True
+
+        # Structural state for the envelope scan
+        self._stack: List[List[Any]] = []  # [container, expecting_key, current_key]
+        self._in_string = False
+        self._escape = False
+        self._string_chars: List[str] = []
+        self.count = 0
+
+    # ---------------- public API ----------------
+
+    def feed(self, chunk: bytes) -> List[Dict[str, Any]]:
+        """Consume a chunk of the body, return picks completed by it."""
+        text = self._decoder.decode(chunk)
+        return self._consume(text) if text else []
+
+    def close(self) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Finish the stream. Returns (envelope, remaining_picks) where
+        envelope is the parsed body with data.picks == [].
+        Raises ValueError if the body was truncated or isn't JSON.
+        """
+        tail = self._consume(self._decoder.decode(b"", final=True))
+        if self._in_picks or self._buf.strip():
+            raise ValueError("Oddible response ended in the middle of data.picks")
+        envelope = json.loads("".join(self._envelope))
+        return envelope, tail
+
+    # ---------------- internals ----------------
+
+    def _consume(self, text: str) -> List[Dict[str, Any]]:
+        out: List[Dict[str, Any]] = []
+        i = 0
+        n = len(text)
+        while i < n:
+            if self._in_picks:
+                self._buf += text[i:]
+                i = n
+                rest = self._drain_picks(out)
+                if rest is not None:
+                    # Picks array closed: the remainder is envelope again
+                    text, i, n = rest, 0, len(rest)
+                continue
+
+            ch = text[i]
+            i += 1
+            self._envelope.append(ch)
+            if self._scan_envelope_char(ch):
+                self._in_picks = True
+        return out
+
+    def _scan_envelope_char(self, ch: str) -> bool:
+        """Track JSON structure; True when ch opens the data.picks array."""
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+                self._string_chars.append(ch)
+            elif ch == "\\":
+                self._escape = True
+                self._string_chars.append(ch)
+            elif ch == '"':
+                self._in_string = False
+                frame = self._stack[-1] if self._stack else None
+                if frame is not None and frame[0] == "{" and frame[1]:
+                    frame[2] = json.loads('"' + "".join(self._string_chars) + '"')
+            else:
+                self._string_chars.append(ch)
+            return False
+
+        if ch == '"':
+            self._in_string = True
+            self._string_chars = []
+        elif ch == "{":
+            self._stack.append(["{", True, None])
+        elif ch == "[":
+            path = [frame[2] for frame in self._stack if frame[0] == "{"]
+            opens_picks = (
+                not self._picks_done
+                and len(self._stack) == 2
+                and path == ["data", "picks"]
+            )
+            self._stack.append(["[", False, None])
+            return opens_picks
+        elif ch in "}]":
+            if self._stack:
+                self._stack.pop()
+        elif ch == ":":
+            if self._stack and self._stack[-1][0] == "{":
+                self._stack[-1][1] = False
+        elif ch == ",":
+            if self._stack and self._stack[-1][0] == "{":
+                self._stack[-1][1] = True
+        return False
+
+    def _drain_picks(self, out: List[Dict[str, Any]]) -> Optional[str]:
+        """
+        Decode every complete pick in the buffer into out.
+        Returns the text after the closing ']' once the array ends, else None.
+        """
+        buf = self._buf
+        pos = 0
+        n = len(buf)
+        while True:
+            while pos < n and buf[pos] in _WHITESPACE:
+                pos += 1
+            if pos < n and buf[pos] == "," and not self._first_pick:
+                pos += 1
+                while pos < n and buf[pos] in _WHITESPACE:
+                    pos += 1
+            if pos >= n:
+                break
+            if buf[pos] == "]":
+                # End of data.picks: hand the rest back to the envelope scan
+                self._in_picks = False
+                self._picks_done = True
+                self._buf = ""
+                return buf[pos:]
+            try:
+                item, end = self._json.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                break  # incomplete pick; wait for more bytes
+            if not isinstance(item, dict) and end >= n:
+                break  # a bare number might still be growing
+            self._first_pick = False
+            self.count += 1
+            if isinstance(item, dict):
+                out.append(trim_pick(item, self.fields) if self.fields is not None else item)
+            pos = end
+
+        self._buf = buf[pos:]
+        return None
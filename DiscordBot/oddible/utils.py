@@ -1,8 +1,15 @@
 import json
-from typing import Dict, Tuple, Optional, List
-from collections import defaultdict
+import re
+from typing import Dict, Iterator, Tuple, Optional, List
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
 import discord
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; select_group_picks falls back to pure Python
+    np = None
+
 NBA_TEAMS = {
     "ATL": "Atlanta Hawks",
     "BOS": "Boston Celtics",
@@ -39,6 +46,59 @@ NBA_TEAMS = {
 # Simple helper so we can go "Utah Jazz" -> "UTA"
 NBA_NAME_TO_ABBR = {name.lower(): abbr for abbr, name in NBA_TEAMS.items()}
 
+# Nicknames that aren't just the last word of the full name (or are extra)
+NBA_TEAM_NICKNAMES = {
+    "POR": ["Trail Blazers", "Blazers"],
+    "PHI": ["76ers", "Sixers"],
+    "MIN": ["Timberwolves", "Wolves"],
+    "OKC": ["Thunder"],
+}
+
+NFL_TEAMS = {
+    "ARI": "Arizona Cardinals",
+    "ATL": "Atlanta Falcons",
+    "BAL": "Baltimore Ravens",
+    "BUF": "Buffalo Bills",
+    "CAR": "Carolina Panthers",
+    "CHI": "Chicago Bears",
+    "CIN": "Cincinnati Bengals",
+    "CLE": "Cleveland Browns",
+    "DAL": "Dallas Cowboys",
+    "DEN": "Denver Broncos",
+    "DET": "Detroit Lions",
+    "GB": "Green Bay Packers",
+    "HOU": "Houston Texans",
+    "IND": "Indianapolis Colts",
+    "JAX": "Jacksonville Jaguars",
+    "KC": "Kansas City Chiefs",
+    "LAC": "Los Angeles Chargers",
+    "LAR": "Los Angeles Rams",
+    "LV": "Las Vegas Raiders",
+    "MIA": "Miami Dolphins",
+    "MIN": "Minnesota Vikings",
+    "NE": "New England Patriots",
+    "NO": "New Orleans Saints",
+    "NYG": "New York Giants",
+    "NYJ": "New York Jets",
+    "PHI": "Philadelphia Eagles",
+    "PIT": "Pittsburgh Steelers",
+    "SEA": "Seattle Seahawks",
+    "SF": "San Francisco 49ers",
+    "TB": "Tampa Bay Buccaneers",
+    "TEN": "Tennessee Titans",
+    "WAS": "Washington Commanders",
+}
+
+NFL_TEAM_NICKNAMES = {
+    "SF": ["Niners"],
+}
+
+# League -> (abbr -> full name, abbr -> extra nicknames). Add NHL/MLB here.
+TEAM_TABLES: Dict[str, Tuple[Dict[str, str], Dict[str, List[str]]]] = {
+    "NBA": (NBA_TEAMS, NBA_TEAM_NICKNAMES),
+    "NFL": (NFL_TEAMS, NFL_TEAM_NICKNAMES),
+}
+
 # Books we prefer for "Bet now" CTAs (deeplinks)
 # NOTE: keys are lower-case because parse_deeplinks() lowercases them.
 DEEPLINK_PRIORITY = [
@@ -92,6 +152,79 @@ GROUP_COLOURS = {
     "other": discord.Colour.dark_grey(),
 }
 
+# ---------- Team resolution ----------
+
+
+class TeamResolver:
+    """
+    Finds which team a piece of text is about, for one league.
+
+    Built once per league: full names (any case), nicknames (as written,
+    e.g. "Celtics") and abbreviations (upper-case, e.g. "BOS") are folded
+    into a single word-bounded regex, so each string is scanned once no
+    matter how many teams the table has, and "MIN" no longer matches
+    inside "MINUTES" or "den" inside "Camden".
+    """
+
+    def __init__(self, teams: Dict[str, str], nicknames: Optional[Dict[str, List[str]]] = None):
+        self.teams = teams
+        self._exact: Dict[str, str] = {}   # lower-cased name/nickname/abbr -> abbr
+        self._lookup: Dict[str, str] = {}  # matched text (normalised) -> abbr
+
+        names: List[str] = []
+        short: List[str] = []
+        for abbr, fullname in teams.items():
+            nicks = [fullname.rsplit(" ", 1)[-1]] + list((nicknames or {}).get(abbr, []))
+            self._exact[fullname.lower()] = abbr
+            self._exact[abbr.lower()] = abbr
+            self._lookup[fullname.lower()] = abbr
+            self._lookup[abbr] = abbr
+            names.append(fullname)
+            short.append(abbr)
+            for nick in nicks:
+                self._exact.setdefault(nick.lower(), abbr)
+                self._lookup.setdefault(nick, abbr)
+                short.append(nick)
+
+        def _alt(words: List[str]) -> str:
+            return "|".join(re.escape(w) for w in sorted(set(words), key=len, reverse=True))
+
+        self._pattern = re.compile(rf"\b(?:(?i:{_alt(names)})|{_alt(short)})\b")
+
+    def exact(self, text: str) -> Optional[str]:
+        """Abbreviation if the whole string is a team name / nickname / abbreviation."""
+        if not text:
+            return None
+        return self._exact.get(text.strip().lower())
+
+    def find(self, text: str) -> Optional[str]:
+        """Abbreviation of the first team mentioned in text, if any."""
+        if not text:
+            return None
+        m = self._pattern.search(text)
+        if not m:
+            return None
+        found = m.group(0)
+        return self._lookup.get(found) or self._lookup.get(found.lower())
+
+    def resolve(self, *texts: str) -> Optional[str]:
+        """First team mentioned across texts, checked in order."""
+        for text in texts:
+            abbr = self.find(text)
+            if abbr:
+                return abbr
+        return None
+
+
+@lru_cache(maxsize=None)
+def get_team_resolver(league: str = "NBA") -> Optional[TeamResolver]:
+    """Shared TeamResolver for a league (None if we have no table for it)."""
+    table = TEAM_TABLES.get(league.upper())
+    if table is None:
+        return None
+    return TeamResolver(*table)
+
+
 # ---------- Deeplink helpers ----------
 
 
@@ -122,16 +255,43 @@ def pick_best_deeplink(deep_links: Dict[str, str], priority=None) -> Optional[Tu
             return book, url
     return None
 
+# Placeholders Oddible puts in deeplink URLs
+_PLACEHOLDER_RE = re.compile(r"\{(state|wagerAmount)\}")
+
+
+def split_deeplink_template(url: str) -> Tuple[str, ...]:
+    """
+    Split a deeplink URL into (literal, placeholder, literal, ...):
+    odd positions hold placeholder names. No placeholders -> a 1-tuple.
+    """
+    return tuple(_PLACEHOLDER_RE.split(url))
+
+
 def fill_placeholders(url: str, state: str = "ny", wager_amount: Optional[int] = None) -> str:
     """
     Replace placeholders like {state} and {wagerAmount} when present.
     """
     if not url:
         return url
-    url = url.replace("{state}", state)
-    if wager_amount is not None:
-        url = url.replace("{wagerAmount}", str(wager_amount))
-    return url
+    parts = split_deeplink_template(url)
+    if len(parts) == 1:
+        return url
+    values = {
+        "state": state,
+        "wagerAmount": str(wager_amount) if wager_amount is not None else "{wagerAmount}",
+    }
+    return "".join(values[part] if i % 2 else part for i, part in enumerate(parts))
+
+
+# Deeplink URLs carry event IDs, so only re-renders of recent boards hit:
+# a few boards' worth of links, per region, is all that's worth keeping
+DEEPLINK_CACHE_SIZE = 2048
+
+
+@lru_cache(maxsize=DEEPLINK_CACHE_SIZE)
+def deeplink_markdown(book: str, template: str, state: str) -> str:
+    """'[Book](url)' for one book's link in one state, cached per (book, template, state)."""
+    return f"[{book.title()}]({fill_placeholders(template, state)})"  # masked link, no big preview
 
 def format_deeplink_block(
     deep_links: Dict[str, str],
@@ -166,8 +326,7 @@ def format_deeplink_block(
         raw_url = deep_links.get(book)
         if not raw_url:
             continue
-        url = fill_placeholders(raw_url, state)
-        parts.append(f"[{book.title()}]({url})")  # masked link, no big preview
+        parts.append(deeplink_markdown(book, raw_url, state))
 
     if not parts:
         return ""
@@ -178,6 +337,8 @@ def format_deeplink_block(
 # ---------- Hit-rate & dedupe helpers ----------
 
 def hitrate_text(p: dict) -> str:
+    if isinstance(p, Pick):
+        return p.hitrate
     wins = p.get("hit_rate_wins")
     total = p.get("hit_rate_total")
     pct = p.get("hit_rate_percentage")
@@ -209,6 +370,8 @@ def pick_key(p: dict) -> tuple:
     Identify the “same bet idea” to dedupe *exact* duplicates.
     Make this fine-grained enough that different players / lines don't collide.
     """
+    if isinstance(p, Pick):
+        return p.key
     return (
         p.get("home_team"),
         p.get("away_team"),
@@ -219,11 +382,28 @@ def pick_key(p: dict) -> tuple:
     )
 
 
+def pick_fingerprint(p: dict) -> tuple:
+    """
+    Everything a rendered pick card depends on: the pick_key() fields plus
+    odds, hit rate and the raw deeplinks. Same fingerprint -> same embed.
+    """
+    return (
+        pick_key(p),
+        p.get("bestOdds"),
+        p.get("hit_rate_wins"),
+        p.get("hit_rate_total"),
+        p.get("hit_rate_percentage"),
+        p.get("deepLinks"),
+    )
+
+
 def pick_score(p: dict) -> Tuple[float, float]:
     """
     Score a pick for ranking: higher hit rate first, then better odds.
     Returns (hit_rate_pct, odds).
     """
+    if isinstance(p, Pick):
+        return p.score
     pct = p.get("hit_rate_percentage")
     odds = p.get("bestOdds")
 
@@ -240,6 +420,42 @@ def pick_score(p: dict) -> Tuple[float, float]:
     return pct_val, odds_val
 
 
+def player_key(p: dict) -> str:
+    """Who a player prop is about (lower-cased), for one-pick-per-player rules."""
+    if isinstance(p, Pick):
+        return p.player_key
+    player = (p.get("outcome_description") or "").strip()
+    # fall back to outcome_name if description is missing
+    if not player:
+        player = (p.get("outcome_name") or "").strip()
+    key = player.lower()
+    if not key:
+        # If somehow no name, treat it as unique
+        key = repr((
+            p.get("home_team"),
+            p.get("away_team"),
+            p.get("market"),
+            p.get("outcome_name") or p.get("outcome_point"),
+        ))
+    return key
+
+
+def game_key(p: dict) -> Tuple[str, str]:
+    """(away, home) for one-pick-per-game rules."""
+    if isinstance(p, Pick):
+        return p.game_key
+    away = (p.get("away_team_abbreviation") or p.get("away_team") or "").strip()
+    home = (p.get("home_team_abbreviation") or p.get("home_team") or "").strip()
+    return away, home
+
+
+def pick_deeplinks(p: dict) -> Dict[str, str]:
+    """Parsed {book: url} deeplinks for a pick."""
+    if isinstance(p, Pick):
+        return p.deep_links
+    return parse_deeplinks(p.get("deepLinks", ""))
+
+
 def dedupe_and_diversify(picks: List[dict], max_out: int = 3) -> List[dict]:
     """
     Prefer unique matchups/markets; drop near-duplicates.
@@ -256,7 +472,7 @@ def dedupe_and_diversify(picks: List[dict], max_out: int = 3) -> List[dict]:
             break
     return out
 
-def format_pick_line(p: dict) -> str:
+def format_pick_line(p: dict, resolver: Optional[TeamResolver] = None) -> str:
     """
     Turn a pick dict into a clean one-liner for Discord text.
 
@@ -282,29 +498,13 @@ def format_pick_line(p: dict) -> str:
     lower_market = market.lower()
 
     # ---------- try to detect which TEAM this pick is on ----------
-    team_abbr: Optional[str] = None
+    teams = resolver or get_team_resolver(p.get("league") or "NBA")
 
-    # 1) outcome_name might literally be the team name ("Utah Jazz" or "UTA")
-    on_lower = outcome_name.lower()
-    if on_lower in NBA_NAME_TO_ABBR:
-        team_abbr = NBA_NAME_TO_ABBR[on_lower]
-    elif outcome_name.upper() in NBA_TEAMS:
-        team_abbr = outcome_name.upper()
-
-    # 2) look inside the description / market for a team mention
-    if not team_abbr:
-        text_blobs = [desc, market]
-        for text in text_blobs:
-            if not text:
-                continue
-            tlow = text.lower()
-            tup = text.upper()
-            for abbr, fullname in NBA_TEAMS.items():
-                if fullname.lower() in tlow or abbr in tup:
-                    team_abbr = abbr
-                    break
-            if team_abbr:
-                break
+    # 1) outcome_name might literally be the team name ("Utah Jazz" or "UTA"),
+    # 2) otherwise look inside the description / market for a team mention
+    team_abbr: Optional[str] = None
+    if teams is not None:
+        team_abbr = teams.exact(outcome_name) or teams.resolve(desc, market)
 
     # ---------- classify the pick type (only for formatting, not grouping) ----------
     is_player_market = "player" in lower_market
@@ -368,54 +568,248 @@ def format_pick_line(p: dict) -> str:
 
 
 
+# ---------- Normalised pick records ----------
+
+
+class Pick:
+    """
+    One Oddible pick, parsed once per response.
+
+    Carries everything the pipeline keeps asking for (dedupe key, numeric
+    score, market group, player/game keys) so nothing is re-parsed per
+    stage. Deeplinks and the hit-rate text are only needed for picks that
+    actually get rendered, so they're parsed on first use and then kept.
+    .get() reads the raw dict, so code written for raw picks still works.
+    """
+
+    __slots__ = (
+        "raw", "key", "score", "group", "player_key", "game_key",
+        "_deep_links", "_hitrate",
+    )
+
+    def __init__(self, raw: dict):
+        self.raw = raw
+        self.key = pick_key(raw)
+        self.score = pick_score(raw)
+        self.group = classify_pick(raw)
+        self.player_key = player_key(raw)
+        self.game_key = game_key(raw)
+        self._deep_links: Optional[Dict[str, str]] = None
+        self._hitrate: Optional[str] = None
+
+    def get(self, name: str, default=None):
+        return self.raw.get(name, default)
+
+    def __getitem__(self, name: str):
+        return self.raw[name]
+
+    def __repr__(self) -> str:
+        return f"Pick({self.group}, {self.key!r})"
+
+    @property
+    def deep_links(self) -> Dict[str, str]:
+        if self._deep_links is None:
+            self._deep_links = parse_deeplinks(self.raw.get("deepLinks", ""))
+        return self._deep_links
+
+    @property
+    def hitrate(self) -> str:
+        if self._hitrate is None:
+            self._hitrate = hitrate_text(self.raw)
+        return self._hitrate
+
+
+# Recently normalised responses: id(raw_json) -> [raw_json, picks, columns].
+# Cached responses are the same dict objects on every hit, so a board
+# rendered from cache reuses its Pick records instead of rebuilding them.
+_NORMALIZED: "OrderedDict[int, list]" = OrderedDict()
+_NORMALIZED_MAX = 32
+
+
+def _normalized_entry(raw_json: dict) -> list:
+    memo = _NORMALIZED.get(id(raw_json))
+    if memo is not None and memo[0] is raw_json:
+        _NORMALIZED.move_to_end(id(raw_json))
+        return memo
+
+    data = raw_json.get("data") or {}
+    picks = [p if isinstance(p, Pick) else Pick(p) for p in data.get("picks") or []]
+
+    memo = [raw_json, picks, None]
+    _NORMALIZED[id(raw_json)] = memo
+    while len(_NORMALIZED) > _NORMALIZED_MAX:
+        _NORMALIZED.popitem(last=False)
+    return memo
+
+
+def normalize_picks(raw_json: dict) -> List[Pick]:
+    """Turn an Oddible response's data.picks into Pick records (memoised per response)."""
+    return _normalized_entry(raw_json)[1]
+
+
+def adopt_picks(raw_json: dict, picks: List[Pick]):
+    """
+    Seed the normalize_picks() memo with records that were already built
+    for this response's data.picks (e.g. one by one while it streamed in).
+    """
+    _NORMALIZED[id(raw_json)] = [raw_json, picks, None]
+    _NORMALIZED.move_to_end(id(raw_json))
+    while len(_NORMALIZED) > _NORMALIZED_MAX:
+        _NORMALIZED.popitem(last=False)
+
+
+def slice_response(raw_json: dict, league: str, player_props: Optional[bool] = None) -> Optional[dict]:
+    """
+    One league's share of a multi-league response, shaped like a response
+    for that league alone. player_props filters like the API does:
+    True → props only, False → no props, None → everything.
+    Returns None if a pick doesn't say which league it's from.
+    The slice reuses the response's Pick records.
+    """
+    league = league.upper()
+    records: List[Pick] = []
+    for p in normalize_picks(raw_json):
+        pick_league = p.get("league")
+        if not pick_league:
+            return None
+        if str(pick_league).upper() != league:
+            continue
+        if player_props is not None and (p.group == "player_props") != player_props:
+            continue
+        records.append(p)
+
+    data = raw_json.get("data") or {}
+    sliced = {
+        **raw_json,
+        "data": {**data, "count": len(records), "leagues": [league], "picks": [p.raw for p in records]},
+    }
+    adopt_picks(sliced, records)
+    return sliced
+
+
 # ---------- Market classification & grouping ----------
 
-def classify_pick(p: dict) -> str:
+# Stat words that make a market a player prop, per sport. Add new sports /
+# terms here (or at runtime via register_market_terms) – each rule's terms
+# are merged into one compiled pattern, so extra terms don't add extra passes.
+PLAYER_STAT_TERMS: Dict[str, List[str]] = {
+    "NBA": [
+        "points", "assists", "rebounds", "pra", "steals", "blocks",
+        "threes", "3pt", "three pointers", "made threes", "turnovers",
+    ],
+    "NFL": [
+        "yards", "touchdowns", "receptions",
+        "completions", "passing", "rushing", "receiving",
+    ],
+}
+
+# Market rules in priority order: (group, substrings of the lower-cased market).
+# An earlier group always wins over a later one, wherever the terms appear.
+MARKET_RULES: List[Tuple[str, List[str]]] = [
+    ("player_props", [t for terms in PLAYER_STAT_TERMS.values() for t in terms]),
+    ("spread", ["spread", "handicap", "ats"]),
+    ("totals", ["total"]),
+    ("moneyline", ["moneyline"]),
+]
+
+# Exact (whole-string) matches that only apply if no market rule fired
+TOTALS_OUTCOME_NAMES = {"over", "under"}
+MONEYLINE_MARKETS = {"ml"}
+
+
+def _compile_rules(rules: List[Tuple[str, List[str]]]) -> List[Tuple[str, "re.Pattern"]]:
     """
-    Accurate classification:
-    - player_props → stat-based markets
-    - totals      → game/team totals
-    - spread      → spreads/handicaps
-    - moneyline   → ML
-    - other       → everything else
+    One plain alternation per rule, in priority order. search() finds a
+    term wherever it starts, so each pattern matches exactly like
+    `any(term in text for term in terms)`, in one pass over the text;
+    classifying tries the rules one after another.
     """
-    market = (p.get("market") or "").lower()
-    name = (p.get("outcome_name") or "").lower()
+    compiled = []
+    for group, terms in rules:
+        ordered = sorted(set(terms), key=len, reverse=True)
+        compiled.append((group, re.compile("|".join(re.escape(t) for t in ordered))))
+    return compiled
 
-    # ----- PLAYER PROPS -----
-    stat_terms = [
-        "points","assists","rebounds","pra","steals","blocks",
-        "threes","3pt","three pointers","made threes",
-        "turnovers","yards","touchdowns","receptions",
-        "completions","passing","rushing","receiving"
-    ]
-    if any(term in market for term in stat_terms):
-        return "player_props"
-    if any(term in name for term in stat_terms):
+
+def _rebuild_classifier():
+    global _MARKET_RES, _STAT_RE
+    _MARKET_RES = _compile_rules(MARKET_RULES)
+    _STAT_RE = _MARKET_RES[0][1]
+    _classify_strings.cache_clear()
+
+
+def register_market_terms(group: str, terms: List[str], sport: Optional[str] = None):
+    """
+    Add classification terms at runtime and recompile.
+    For player props pass `sport` so the terms also land in PLAYER_STAT_TERMS.
+    """
+    if group == "player_props" and sport:
+        PLAYER_STAT_TERMS.setdefault(sport, []).extend(terms)
+    for i, (g, existing) in enumerate(MARKET_RULES):
+        if g == group:
+            MARKET_RULES[i] = (g, existing + list(terms))
+            break
+    else:
+        raise KeyError(f"Unknown market group: {group}")
+    _rebuild_classifier()
+
+
+@lru_cache(maxsize=4096)
+def _classify_strings(market: str, name: str) -> str:
+    """
+    One search of the market per rule until one matches (stopping at once
+    on a stat term) and at most one of the outcome name, using the patterns
+    compiled from MARKET_RULES.
+    Memoised: boards only ever use a few dozen market / outcome combinations.
+    """
+    market = market.lower()
+    name = name.lower()
+
+    # First (highest-priority) market rule that matches anywhere in the market
+    best_group = None
+    for group, pattern in _MARKET_RES:
+        if pattern.search(market):
+            if group == "player_props":
+                return group
+            best_group = group
+            break
+
+    # ----- PLAYER PROPS via the outcome name -----
+    if _STAT_RE.search(name):
         return "player_props"
 
-    # ----- SPREAD -----
-    if "spread" in market or "handicap" in market or "ats" in market:
-        return "spread"
+    if best_group is not None and best_group != "moneyline":
+        return best_group
 
-    # ----- TOTALS (non-props) -----
-    if "total" in market:
-        return "totals"
     # plain “Over” / “Under” for game totals
-    if name in ("over", "under"):
+    if name in TOTALS_OUTCOME_NAMES:
         return "totals"
 
-    # ----- MONEYLINE -----
-    if "moneyline" in market or market == "ml":
+    if best_group == "moneyline" or market in MONEYLINE_MARKETS:
         return "moneyline"
 
     return "other"
 
+
+_rebuild_classifier()
+
+
+def classify_pick(p: dict) -> str:
+    """
+    Accurate classification:
+    - player_props → stat-based markets
+    - totals      → game/team totals
+    - spread      → spreads/handicaps
+    - moneyline   → ML
+    - other       → everything else
+    """
+    return _classify_strings(p.get("market") or "", p.get("outcome_name") or "")
+
 def group_picks_by_type(picks: List[dict]) -> Dict[str, List[dict]]:
     """Return a dict of buckets: {spread: [...], totals: [...], ...}"""
     groups: Dict[str, List[dict]] = defaultdict(list)
     for p in picks:
-        g = classify_pick(p)
+        g = p.group if isinstance(p, Pick) else classify_pick(p)
         groups[g].append(p)
     return groups
 
@@ -433,19 +827,7 @@ def select_group_picks(
     if group_name == "player_props":
         by_player: Dict[str, dict] = {}
         for p in bucket:
-            player = (p.get("outcome_description") or "").strip()
-            # fall back to outcome_name if description is missing
-            if not player:
-                player = (p.get("outcome_name") or "").strip()
-            key = player.lower()
-            if not key:
-                # If somehow no name, treat it as unique
-                key = repr((
-                    p.get("home_team"),
-                    p.get("away_team"),
-                    p.get("market"),
-                    p.get("outcome_name") or p.get("outcome_point"),
-                ))
+            key = player_key(p)
 
             # Keep the best pick per player
             if key not in by_player or pick_score(p) > pick_score(by_player[key]):
@@ -459,9 +841,7 @@ def select_group_picks(
     if group_name == "totals":
         by_game: Dict[Tuple[str, str], dict] = {}
         for p in bucket:
-            away = (p.get("away_team_abbreviation") or p.get("away_team") or "").strip()
-            home = (p.get("home_team_abbreviation") or p.get("home_team") or "").strip()
-            key = (away, home)
+            key = game_key(p)
 
             # Keep the best pick per game
             if key not in by_game or pick_score(p) > pick_score(by_game[key]):
@@ -475,6 +855,148 @@ def select_group_picks(
     return dedupe_and_diversify(bucket, max_out=max_per_group)
 
 
+# ---------- Vectorised ranking (NumPy) ----------
+
+# Below this many picks the plain-Python path is as fast as building arrays
+VECTORIZE_MIN_PICKS = 256
+
+
+def _factorize(values: list) -> "np.ndarray":
+    """Integer code per value, numbered in order of first appearance."""
+    code_of = {v: i for i, v in enumerate(dict.fromkeys(values))}
+    return np.fromiter(map(code_of.__getitem__, values), dtype=np.intp, count=len(values))
+
+
+class PickColumns:
+    """
+    Columnar view of one response's Pick records for ranking big boards.
+
+    Built once per response (memoised next to the Pick records): hit rate,
+    odds, group codes, player / game codes and a first-occurrence mask for
+    the global pick_key dedupe. select() then does the per-player / per-game
+    "best of" with a grouped argmax (lexsort + run starts) and narrows to
+    the top k with argpartition, with output identical to the dict + full
+    sort in select_group_picks().
+    """
+
+    def __init__(self, picks: List[Pick]):
+        n = len(picks)
+        self.picks = picks
+        scores = [p.score for p in picks]
+        self.pct = np.fromiter((sc[0] for sc in scores), dtype=np.float64, count=n)
+        self.odds = np.fromiter((sc[1] for sc in scores), dtype=np.float64, count=n)
+        # Python's ordering rules for NaN can't be reproduced with arrays
+        self.has_nan = bool(np.isnan(self.pct).any() or np.isnan(self.odds).any())
+
+        group_code = {g: i for i, g in enumerate(GROUP_ORDER)}
+        self.group = np.fromiter(
+            (group_code.get(p.group, len(GROUP_ORDER)) for p in picks), dtype=np.intp, count=n
+        )
+        self.player = _factorize([p.player_key for p in picks])
+        self.game = _factorize([p.game_key for p in picks])
+
+        # dedupe_and_diversify(picks, max_out=len(picks)): first row per pick_key
+        keys = _factorize([p.key for p in picks])
+        self.unique = np.zeros(n, dtype=bool)
+        self.unique[np.unique(keys, return_index=True)[1]] = True
+
+    def select(self, group_name: str, k: int) -> List[Pick]:
+        """select_group_picks() for one group of the deduped board."""
+        if group_name not in GROUP_ORDER or k <= 0:
+            return []
+        rows = np.flatnonzero(self.unique & (self.group == GROUP_ORDER.index(group_name)))
+        if rows.size == 0:
+            return []
+
+        if group_name == "player_props":
+            codes = self.player[rows]
+        elif group_name == "totals":
+            codes = self.game[rows]
+        else:
+            # Bucket is already unique by pick_key: generic dedupe = first k
+            return [self.picks[i] for i in rows[:k]]
+
+        m = rows.size
+        pos = np.arange(m)
+        pct, odds = self.pct[rows], self.odds[rows]
+
+        # Grouped argmax: per code, best (pct, odds), ties → earliest row
+        by_best = np.lexsort((pos, -odds, -pct, codes))
+        starts = np.empty(m, dtype=bool)
+        starts[0] = True
+        sorted_codes = codes[by_best]
+        np.not_equal(sorted_codes[1:], sorted_codes[:-1], out=starts[1:])
+        winners = by_best[starts]
+        # Where each code first appears in this bucket (the tie-break order
+        # of the dict in select_group_picks); same run layout as by_best
+        first_seen = np.lexsort((pos, codes))[starts]
+
+        w_pct, w_odds = pct[winners], odds[winners]
+        if winners.size > k:
+            # Everything at least as good as the k-th best hit rate (ties kept)
+            kth = np.partition(-w_pct, k - 1)[k - 1]
+            cand = np.flatnonzero(-w_pct <= kth)
+        else:
+            cand = np.arange(winners.size)
+        top = cand[np.lexsort((first_seen[cand], -w_odds[cand], -w_pct[cand]))][:k]
+        return [self.picks[i] for i in rows[winners[top]]]
+
+
+def pick_columns(raw_json: dict) -> Optional[PickColumns]:
+    """Memoised PickColumns for a response (None without NumPy)."""
+    if np is None:
+        return None
+    memo = _normalized_entry(raw_json)
+    if memo[2] is None:
+        memo[2] = PickColumns(memo[1])
+    return memo[2]
+
+
+def iter_board(raw_json: dict, max_per_group: int = 3) -> Iterator[Tuple[str, List[Pick]]]:
+    """
+    select_board() one group at a time: yields (group, picks) in
+    GROUP_ORDER, skipping empty groups. The whole-response work (dedupe /
+    columns) happens up front; each group's selection only runs when the
+    caller asks for it, so the first group can be shown while the rest
+    are still being picked.
+    """
+    picks = normalize_picks(raw_json)
+    if not picks:
+        return
+
+    if len(picks) >= VECTORIZE_MIN_PICKS:
+        cols = pick_columns(raw_json)
+        if cols is not None and not cols.has_nan:
+            for gkey in GROUP_ORDER:
+                selected = cols.select(gkey, max_per_group)
+                if selected:
+                    yield gkey, selected
+            return
+
+    # Global dedupe first, then bucket by type
+    deduped = dedupe_and_diversify(picks, max_out=len(picks))
+    groups = group_picks_by_type(deduped)
+
+    for gkey in GROUP_ORDER:
+        bucket = groups.get(gkey, [])
+        if not bucket:
+            continue
+        # Apply group-specific selection rules & cap per group
+        bucket = select_group_picks(gkey, bucket, max_per_group)
+        if bucket:
+            yield gkey, bucket
+
+
+def select_board(raw_json: dict, max_per_group: int = 3) -> Dict[str, List[Pick]]:
+    """
+    Dedupe, group and select a whole response in one go:
+      { "spread": [Pick, ...], "totals": [...], ... } in GROUP_ORDER.
+    Large boards use the NumPy PickColumns engine; small ones (or NaN
+    scores, or no NumPy) the plain-Python helpers. Both give the same picks.
+    """
+    return dict(iter_board(raw_json, max_per_group=max_per_group))
+
+
 def build_discord_message_grouped(
     raw_json: dict,
     title: str = "🏀 NBA – Top Insights (Powered by Oddible)",
@@ -485,17 +1007,13 @@ def build_discord_message_grouped(
     Build a clean Discord-ready message grouped by:
     spread, totals, moneyline, player props, other.
     """
-    data = raw_json.get("data") or {}
-    picks = data.get("picks") or []
+    picks = normalize_picks(raw_json)
 
     if not picks:
         return f"**{title}**\nNo picks available."
 
-    # STEP 1: dedupe across ALL picks once
-    deduped = dedupe_and_diversify(picks, max_out=len(picks))  # effectively "unique list"
-
-    # STEP 2: then group them
-    groups = group_picks_by_type(deduped)
+    # Dedupe across ALL picks once, group, then group-aware selection
+    board = select_board(raw_json, max_per_group=max_per_group)
 
     msg = f"**{title}**\n"
 
@@ -508,12 +1026,7 @@ def build_discord_message_grouped(
     ]
 
     for gkey, header in ordered_sections:
-        bucket = groups.get(gkey, [])
-        if not bucket:
-            continue
-
-        # NEW: group-aware dedupe/selection
-        bucket = select_group_picks(gkey, bucket, max_per_group)
+        bucket = board.get(gkey)
         if not bucket:
             continue
 
@@ -523,7 +1036,7 @@ def build_discord_message_grouped(
             line = format_pick_line(p)
 
             # DeepLink handling – show multiple books in priority order
-            dl = parse_deeplinks(p.get("deepLinks", ""))
+            dl = pick_deeplinks(p)
             deeplink_block = format_deeplink_block(dl, state=state, max_books=3)
 
             if deeplink_block: